@@ -10,6 +10,7 @@ try:
     import config
     from core.qa import QASystem
     from core.visual_abstract import VisualAbstractGenerator
+    from utils.layout_designer import LAYOUT_TYPES
     from agents.extraction_agent import EvidenceExtractorAgent
     # Ensure config loads properly
     _ = config.OPENAI_API_KEY
@@ -24,6 +25,17 @@ logger = logging.getLogger(__name__)
 
 st.set_page_config(page_title="Medical Visual Abstract Generator", layout="wide")
 
+# Sample questions for cardiovascular trials
+SAMPLE_QUESTIONS = (
+    "What is the primary objective of this trial?",
+    "What are the inclusion and exclusion criteria?",
+    "What are the main results and primary endpoints?",
+    "What is the conclusion of the study?",
+    "How many patients were enrolled in the trial?",
+    "What was the study duration?",
+    "What adverse events were reported?",
+)
+
 st.title("🏥 Medical Visual Abstract Generator")
 st.markdown("---")
 
@@ -35,6 +47,59 @@ model_choice = st.sidebar.radio(
     help="Choose between GPT-3.5 Turbo (faster, cheaper) or GPT-4 (more powerful)"
 )
 
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def render_abstract_png(visual_data_json: str, layout_type: str) -> bytes:
+    """Render the visual abstract to PNG bytes, cached on the canonical JSON of its data."""
+    generator = VisualAbstractGenerator(
+        layout_type=layout_type,
+        trial_data=json.loads(visual_data_json)
+    )
+    generator.generate_abstract()
+    return generator.export_as_bytes()
+
+
+@st.fragment
+def render_visual_abstract_controls(visual_data: dict, pdf_name: str) -> None:
+    """Layout picker and generate button; reruns on their own, not the whole script."""
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("Layout Options")
+        layout_type = st.selectbox(
+            "Select layout style:",
+            options=LAYOUT_TYPES,
+            help="Choose how to arrange the visual abstract"
+        )
+
+    with col2:
+        st.write("")  # Spacing
+
+    if st.button("🎨 Generate Visual Abstract", key="visual_abstract_btn"):
+        with st.spinner("Generating visual abstract... This may take a moment."):
+            try:
+                # Regenerating with unchanged data and layout is served from cache
+                visual_data_json = json.dumps(visual_data, sort_keys=True, default=str)
+                image_bytes = render_abstract_png(visual_data_json, layout_type)
+
+                st.success("✅ Visual abstract generated successfully!")
+
+                # Display image
+                st.image(image_bytes, use_column_width=True)
+
+                # Download button
+                st.download_button(
+                    label="📥 Download Visual Abstract",
+                    data=image_bytes,
+                    file_name=f"visual_abstract_{Path(pdf_name).stem}.png",
+                    mime="image/png"
+                )
+
+            except Exception as e:
+                st.error(f"Error generating visual abstract: {str(e)}")
+                logger.error(f"Visual abstract generation error: {str(e)}")
+
+
 # Main content tabs
 tab1, tab2, tab3 = st.tabs(["📄 Upload & Extract", "❓ Q&A System", "🎨 Visual Abstract"])
 
@@ -96,42 +161,27 @@ with tab2:
     else:
         st.success(f"✅ Paper loaded: {st.session_state.pdf_name}")
 
-        # Sample questions for cardiovascular trials
         st.subheader("Common Questions")
-        sample_questions = [
-            "What is the primary objective of this trial?",
-            "What are the inclusion and exclusion criteria?",
-            "What are the main results and primary endpoints?",
-            "What is the conclusion of the study?",
-            "How many patients were enrolled in the trial?",
-            "What was the study duration?",
-            "What adverse events were reported?"
-        ]
 
         col1, col2 = st.columns([3, 1])
         with col1:
-            selected_question = st.selectbox("Select a predefined question:", sample_questions)
+            selected_question = st.selectbox("Select a predefined question:", SAMPLE_QUESTIONS)
         with col2:
             st.write("")  # Spacing
-            if st.button("Ask Selected Question"):
-                custom_question = selected_question
-                should_ask = True
-            else:
-                should_ask = False
+            question = selected_question if st.button("Ask Selected Question") else None
 
         st.subheader("Or Ask Your Own Question")
-        custom_question = st.text_input("Enter your question about the paper:")
+        # Typing inside a form doesn't trigger a rerun; only the submit button does
+        with st.form("custom_question_form"):
+            custom_question = st.text_input("Enter your question about the paper:")
+            if st.form_submit_button("Ask Custom Question") and custom_question:
+                question = custom_question
 
-        if custom_question and st.button("Ask Custom Question"):
-            should_ask = True
-        else:
-            should_ask = False
-
-        if should_ask and custom_question:
+        if question:
             with st.spinner("Generating answer..."):
                 try:
                     qa_system = st.session_state.qa_system
-                    result = qa_system.generate_answer(custom_question)
+                    result = qa_system.generate_answer(question)
                     answer = result['answer']
 
                     st.success("Answer Generated:")
@@ -142,7 +192,7 @@ with tab2:
                     # Save to session state for visual abstract
                     if "qa_results" not in st.session_state:
                         st.session_state.qa_results = {}
-                    st.session_state.qa_results[custom_question] = answer
+                    st.session_state.qa_results[question] = answer
 
                 except Exception as e:
                     st.error(f"Error generating answer: {str(e)}")
@@ -178,47 +228,7 @@ with tab3:
 
         st.divider()
 
-        col1, col2 = st.columns(2)
-
-        with col1:
-            st.subheader("Layout Options")
-            layout_type = st.selectbox(
-                "Select layout style:",
-                options=["horizontal_3panel", "vertical_stacked"],
-                help="Choose how to arrange the visual abstract"
-            )
-
-        with col2:
-            st.write("")  # Spacing
-
-        if st.button("🎨 Generate Visual Abstract", key="visual_abstract_btn"):
-            with st.spinner("Generating visual abstract... This may take a moment."):
-                try:
-                    generator = VisualAbstractGenerator(
-                        layout_type=layout_type,
-                        trial_data=visual_data
-                    )
-                    generator.generate_abstract()
-
-                    # Get image as bytes
-                    image_bytes = generator.export_as_bytes()
-
-                    st.success("✅ Visual abstract generated successfully!")
-
-                    # Display image
-                    st.image(image_bytes, use_column_width=True)
-
-                    # Download button
-                    st.download_button(
-                        label="📥 Download Visual Abstract",
-                        data=image_bytes,
-                        file_name=f"visual_abstract_{Path(st.session_state.pdf_name).stem}.png",
-                        mime="image/png"
-                    )
-
-                except Exception as e:
-                    st.error(f"Error generating visual abstract: {str(e)}")
-                    logger.error(f"Visual abstract generation error: {str(e)}")
+        render_visual_abstract_controls(visual_data, st.session_state.pdf_name)
 
 # Footer
 st.markdown("---")
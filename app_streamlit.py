@@ -6,14 +6,38 @@ import os
 from pathlib import Path
 
 from core.visual_abstract import VisualAbstractGenerator
+from utils.data_extraction import TrialDataExtractor
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+# Static "Example Trial Data" panel for the Info tab, formatted once at import
+EXAMPLE_TRIAL = {
+    "Trial": "Semaglutide and Cardiovascular Outcomes in Obesity",
+    "Publication": "NEJM 2023",
+    "Patients": "17,604 (8,803 drug, 8,801 placebo)",
+    "Primary Outcome": "Hazard Ratio: 0.80 (95% CI: 0.72-0.90, P<0.001)",
+    "Event Rates": "6.5% vs 8.0%",
+    "Body Weight": "Semaglutide -9.39%, Placebo -0.88%",
+    "Adverse Events": "GI symptoms 16.6% vs 10.0%"
+}
+EXAMPLE_TRIAL_MD = "\n\n".join(f"**{key}:** {value}" for key, value in EXAMPLE_TRIAL.items())
+
+
+@st.cache_data(show_spinner=False)
+def _read_qa_results(path: str, mtime_ns: int):
+    """Parse a QA results file; mtime_ns in the cache key picks up edits."""
+    with open(path) as f:
+        return json.load(f)
 
 
 def load_demo_qa_results():
     """Load demo QA results from file."""
     demo_path = Path("data/debug_output/qa_results.json")
     if demo_path.exists():
-        with open(demo_path) as f:
-            return json.load(f)
+        return _read_qa_results(str(demo_path), demo_path.stat().st_mtime_ns)
     return None
 
 
@@ -21,19 +45,40 @@ def initialize_session_state():
     """Initialize session state variables."""
     if 'qa_results' not in st.session_state:
         st.session_state.qa_results = None
-    if 'abstract_image' not in st.session_state:
-        st.session_state.abstract_image = None
+    if 'abstract_png' not in st.session_state:
+        st.session_state.abstract_png = None
     if 'demo_loaded' not in st.session_state:
         st.session_state.demo_loaded = False
 
 
+@st.cache_data(max_entries=8, show_spinner=False)
+def _qa_results_json(qa_results) -> bytes:
+    """Indented UTF-8 JSON for QA results; cached on content, so reruns and re-uploads reuse it."""
+    # Bytes go to st.download_button as-is, skipping a str -> UTF-8 encode
+    if orjson is not None:
+        return orjson.dumps(qa_results, option=orjson.OPT_INDENT_2)
+    return json.dumps(qa_results, indent=2).encode('utf-8')
+
+
+def get_qa_results_json() -> bytes:
+    """Indented UTF-8 JSON of the current QA results."""
+    return _qa_results_json(st.session_state.qa_results)
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _render_png(qa_results) -> bytes:
+    """Extract and render QA results to PNG; repeat renders of the same content (e.g. the demo) hit the cache."""
+    generator = VisualAbstractGenerator(
+        trial_data=TrialDataExtractor().extract_key_metrics(qa_results)
+    )
+    generator.generate_abstract()
+    return generator.export_as_bytes()
+
+
 def generate_abstract_from_qa(qa_results):
-    """Generate visual abstract from QA results."""
+    """Generate visual abstract from QA results, returned as PNG bytes."""
     try:
-        generator = VisualAbstractGenerator(qa_results_path=None)
-        generator.load_trial_data("data/debug_output/qa_results.json")
-        image = generator.generate_abstract()
-        return image
+        return _render_png(qa_results)
     except Exception as e:
         st.error(f"Error generating abstract: {str(e)}")
         return None
@@ -83,27 +128,23 @@ def main():
             if st.button("🔄 Load Demo", use_container_width=True):
                 st.session_state.qa_results = load_demo_qa_results()
                 if st.session_state.qa_results:
-                    st.session_state.abstract_image = generate_abstract_from_qa(st.session_state.qa_results)
+                    st.session_state.abstract_png = generate_abstract_from_qa(st.session_state.qa_results)
                     st.session_state.demo_loaded = True
 
         st.divider()
 
         # Show abstract if loaded
-        if st.session_state.abstract_image:
-            st.image(st.session_state.abstract_image, use_column_width=True)
+        # PNG is encoded once at generation time; reruns only re-display it
+        if st.session_state.abstract_png:
+            st.image(st.session_state.abstract_png, use_column_width=True)
 
             # Download buttons
             col1, col2, col3 = st.columns(3)
 
             with col1:
-                generator = VisualAbstractGenerator()
-                generator.load_trial_data("data/debug_output/qa_results.json")
-                generator.image = st.session_state.abstract_image
-
-                png_bytes = generator.export_as_bytes()
                 st.download_button(
                     label="📥 Download PNG",
-                    data=png_bytes,
+                    data=st.session_state.abstract_png,
                     file_name="trial_abstract.png",
                     mime="image/png",
                     use_container_width=True
@@ -111,10 +152,9 @@ def main():
 
             with col2:
                 if st.session_state.qa_results:
-                    json_str = json.dumps(st.session_state.qa_results, indent=2)
                     st.download_button(
                         label="📥 Download JSON",
-                        data=json_str,
+                        data=get_qa_results_json(),
                         file_name="qa_results.json",
                         mime="application/json",
                         use_container_width=True
@@ -181,26 +221,13 @@ def main():
                 # Generate button
                 if st.button("🎨 Generate Visual Abstract", type="primary", use_container_width=True):
                     with st.spinner("Generating infographic..."):
-                        # Save uploaded file temporarily
-                        temp_path = "temp_qa_results.json"
-                        with open(temp_path, "w") as f:
-                            json.dump(qa_results, f)
-
-                        try:
-                            generator = VisualAbstractGenerator(qa_results_path=temp_path)
-                            image = generator.generate_abstract()
-                            st.session_state.abstract_image = image
+                        png_bytes = generate_abstract_from_qa(qa_results)
+                        if png_bytes:
+                            st.session_state.abstract_png = png_bytes
 
                             st.success("✅ Visual abstract generated!")
                             st.info("Go to the 'Visual Abstract' tab to view and download")
 
-                        except Exception as e:
-                            st.error(f"Error generating abstract: {str(e)}")
-                        finally:
-                            # Clean up
-                            if Path(temp_path).exists():
-                                Path(temp_path).unlink()
-
             except json.JSONDecodeError:
                 st.error("❌ Invalid JSON file. Please check the format.")
             except Exception as e:
@@ -262,18 +289,7 @@ def main():
         st.divider()
 
         st.subheader("🏥 Example Trial Data")
-        example_trial = {
-            "Trial": "Semaglutide and Cardiovascular Outcomes in Obesity",
-            "Publication": "NEJM 2023",
-            "Patients": "17,604 (8,803 drug, 8,801 placebo)",
-            "Primary Outcome": "Hazard Ratio: 0.80 (95% CI: 0.72-0.90, P<0.001)",
-            "Event Rates": "6.5% vs 8.0%",
-            "Body Weight": "Semaglutide -9.39%, Placebo -0.88%",
-            "Adverse Events": "GI symptoms 16.6% vs 10.0%"
-        }
-
-        for key, value in example_trial.items():
-            st.write(f"**{key}:** {value}")
+        st.markdown(EXAMPLE_TRIAL_MD)
 
         st.divider()
 
@@ -288,7 +304,7 @@ def main():
         with col2:
             st.markdown("""
             **Backend**
-            - Python 3.9+
+            - Python 3.10+
             - OpenAI API
             - Matplotlib
             """)
@@ -1,7 +1,8 @@
 """Embeddings module for converting text to vectors using OpenAI."""
 
 import logging
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 from openai import OpenAI
 from config import OPENAI_API_KEY, EMBEDDING_MODEL, EMBEDDING_DIMENSION
 
@@ -55,14 +56,23 @@ def embed_texts(texts: List[str]) -> List[List[float]]:
         raise
 
 
+@lru_cache(maxsize=256)
+def _cached_embed(model: str, text: str) -> Tuple[float, ...]:
+    """Memoized embedding lookup keyed on (model, text); tuples keep entries immutable."""
+    return tuple(embed_text(text))
+
+
 def embed_query(query: str) -> List[float]:
     """
     Convert query string to embedding vector.
 
+    Repeated queries are served from an in-process LRU cache instead of
+    calling the embeddings API again.
+
     Args:
         query: Query text
 
     Returns:
         Query embedding vector
     """
-    return embed_text(query)
+    return list(_cached_embed(EMBEDDING_MODEL, query))
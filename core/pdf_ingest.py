@@ -5,6 +5,7 @@ import re
 from typing import Dict, List
 import pdfplumber
 import tiktoken
+from config import SECTION_HEADERS
 
 logger = logging.getLogger(__name__)
 
@@ -48,8 +49,6 @@ def detect_sections(text: str) -> Dict[str, int]:
     Returns:
         Dictionary mapping section name to character position in text
     """
-    from config import SECTION_HEADERS
-
     sections = {}
 
     for section in SECTION_HEADERS:
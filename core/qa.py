@@ -1,7 +1,8 @@
 """QA system for generating answers using LLM with retrieved context."""
 
 import logging
-from typing import List, Dict
+from typing import List, Dict, Optional
+import chromadb
 from openai import OpenAI
 from config import OPENAI_API_KEY
 from core.retrieval import RAGPipeline
@@ -15,7 +16,8 @@ client = OpenAI(api_key=OPENAI_API_KEY)
 class QASystem:
     """Question-Answering system using RAG + LLM."""
 
-    def __init__(self, pdf_path: str = None, collection_name: str = "medical_papers", model: str = "gpt-3.5-turbo"):
+    def __init__(self, pdf_path: str = None, collection_name: str = "medical_papers", model: str = "gpt-3.5-turbo",
+                 client: Optional[chromadb.ClientAPI] = None):
         """
         Initialize QA system.
 
@@ -23,9 +25,10 @@ class QASystem:
             pdf_path: Path to PDF to ingest (optional, can be set later)
             collection_name: Chroma collection name
             model: OpenAI model to use (gpt-3.5-turbo or gpt-4)
+            client: Optional Chroma client passed through to the RAG pipeline
         """
         self.model = model
-        self.pipeline = RAGPipeline(collection_name=collection_name)
+        self.pipeline = RAGPipeline(collection_name=collection_name, client=client)
         self.pdf_ingested = False
 
         if pdf_path:
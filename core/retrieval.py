@@ -1,7 +1,8 @@
 """Retrieval pipeline for question-answering over medical papers."""
 
 import logging
-from typing import List, Dict
+from typing import List, Dict, Optional
+import chromadb
 from core.pdf_ingest import pipeline_pdf_to_chunks
 from core.vector_store import VectorStore
 
@@ -11,14 +12,15 @@ logger = logging.getLogger(__name__)
 class RAGPipeline:
     """Retrieval-Augmented Generation pipeline for medical papers."""
 
-    def __init__(self, collection_name: str = "medical_papers"):
+    def __init__(self, collection_name: str = "medical_papers", client: Optional[chromadb.ClientAPI] = None):
         """
         Initialize RAG pipeline.
 
         Args:
             collection_name: Chroma collection name for vector store
+            client: Optional Chroma client to share across pipelines
         """
-        self.vector_store = VectorStore(collection_name=collection_name)
+        self.vector_store = VectorStore(collection_name=collection_name, client=client)
         self.chunks = []
         logger.info("Initialized RAG pipeline")
 
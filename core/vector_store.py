@@ -1,7 +1,7 @@
 """Vector store module for storing and retrieving embeddings using Chroma."""
 
 import logging
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 import chromadb
 from core.embeddings import embed_texts, embed_query
 
@@ -15,36 +15,41 @@ chroma_client = chromadb.PersistentClient(path=CHROMA_DB_PATH)
 class VectorStore:
     """Vector store for managing embeddings and semantic search."""
 
-    def __init__(self, collection_name: str = "medical_papers"):
+    def __init__(self, collection_name: str = "medical_papers", client: Optional[chromadb.ClientAPI] = None):
         """
         Initialize vector store.
 
         Args:
             collection_name: Name of the collection to store/retrieve from
+            client: Optional Chroma client to share (defaults to the persistent client)
         """
         self.collection_name = collection_name
+        self.client = client if client is not None else chroma_client
         # Get or create collection
-        self.collection = chroma_client.get_or_create_collection(
+        self.collection = self.client.get_or_create_collection(
             name=collection_name,
             metadata={"hnsw:space": "cosine"}  # Use cosine similarity
         )
         logger.info(f"Initialized VectorStore with collection: {collection_name}")
 
-    def add_chunks(self, chunks: List[str], chunk_ids: List[str] = None) -> None:
+    def add_chunks(self, chunks: List[str], chunk_ids: List[str] = None,
+                   embeddings: List[List[float]] = None) -> None:
         """
         Add text chunks to the vector store.
 
         Args:
             chunks: List of text chunks
             chunk_ids: Optional list of chunk IDs (auto-generated if not provided)
+            embeddings: Optional precomputed embeddings (skips the OpenAI call)
         """
         try:
             if chunk_ids is None:
                 chunk_ids = [f"chunk_{i}" for i in range(len(chunks))]
 
             # Embed all chunks
-            logger.info(f"Embedding {len(chunks)} chunks...")
-            embeddings = embed_texts(chunks)
+            if embeddings is None:
+                logger.info(f"Embedding {len(chunks)} chunks...")
+                embeddings = embed_texts(chunks)
 
             # Add to collection
             self.collection.add(
@@ -114,8 +119,8 @@ class VectorStore:
         """Clear all documents from the collection."""
         try:
             # Delete collection and recreate
-            chroma_client.delete_collection(name=self.collection_name)
-            self.collection = chroma_client.get_or_create_collection(
+            self.client.delete_collection(name=self.collection_name)
+            self.collection = self.client.get_or_create_collection(
                 name=self.collection_name,
                 metadata={"hnsw:space": "cosine"}
             )
@@ -2,10 +2,44 @@
 
 from PIL import Image, ImageDraw, ImageFont
 import io
+from functools import lru_cache
 from typing import Dict, Any, Tuple
 from utils.data_extraction import TrialDataExtractor
 from utils.layout_designer import LayoutDesigner
-from utils.chart_builder import ChartBuilder
+
+# Static text drawn on every render; built once at import
+DEFAULT_CONCLUSIONS = (
+    "✓ Primary outcome favored intervention",
+    "✓ Safety acceptable",
+    "⚠ Review limitations before applying broadly",
+)
+FOOTER_TEXT = "Generated by Medical Visual Abstract System | Data from Semaglutide Trial (NEJM 2023)"
+
+
+@lru_cache(maxsize=None)
+def _load_font(size: int) -> ImageFont.FreeTypeFont:
+    """Load the system font once per size; fonts are immutable and safe to share."""
+    try:
+        # Try to use default system fonts
+        return ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", size)
+    except (OSError, IOError):
+        # Fallback to default PIL font
+        return ImageFont.load_default()
+
+
+def _or_na(value: Any) -> Any:
+    """Display placeholder for missing values; unlike `or`, keeps 0 and 0.0."""
+    return 'n/a' if value is None or value == "" else value
+
+
+def _fmt_count(value: Any) -> str:
+    """Thousands-separated integer for numbers, placeholder otherwise."""
+    return f"{int(value):,}" if isinstance(value, (int, float)) else f"{_or_na(value)}"
+
+
+def _fmt_num(value: Any, spec: str, suffix: str = "") -> str:
+    """Format numbers with spec and suffix; non-numbers are shown as-is or 'n/a'."""
+    return f"{value:{spec}}{suffix}" if isinstance(value, (int, float)) else f"{_or_na(value)}"
 
 
 class VisualAbstractGenerator:
@@ -22,7 +56,7 @@ class VisualAbstractGenerator:
         """
         self.extractor = TrialDataExtractor()
         self.designer = LayoutDesigner(layout_type)
-        self.builder = ChartBuilder()
+        self._builder = None
         self.trial_data = trial_data
         self.image = None
 
@@ -39,14 +73,27 @@ class VisualAbstractGenerator:
         """Set trial data directly (already structured)."""
         self.trial_data = trial_data
 
+    @property
+    def builder(self):
+        """ChartBuilder, created on first use; the PIL render path never needs matplotlib."""
+        if self._builder is None:
+            from utils.chart_builder import ChartBuilder
+            self._builder = ChartBuilder()
+        return self._builder
+
+    @property
+    def target_size(self) -> Tuple[int, int]:
+        """Output image (width, height), taken from the layout without rendering."""
+        return self.designer.get_image_dimensions()
+
+    @property
+    def target_mode(self) -> str:
+        """PIL mode of the rendered infographic."""
+        return 'RGB'
+
     def _get_font(self, size: int) -> ImageFont.FreeTypeFont:
         """Get system font or default."""
-        try:
-            # Try to use default system fonts
-            return ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", size)
-        except (OSError, IOError):
-            # Fallback to default PIL font
-            return ImageFont.load_default()
+        return _load_font(size)
 
     def _draw_header(self, draw: ImageDraw.ImageDraw) -> None:
         """Draw header section."""
@@ -64,15 +111,18 @@ class VisualAbstractGenerator:
         title_y = header['y'] + 15
         title_text = trial.get('title', 'Clinical Trial').upper()
 
-        # Split title if too long
+        # Split title if too long; track the line length instead of re-joining per word
         title_parts = []
-        words = title_text.split()
         current_line = []
-        for word in words:
-            current_line.append(word)
-            if len(' '.join(current_line)) > 60:
-                title_parts.append(' '.join(current_line[:-1]))
+        current_len = 0
+        for word in title_text.split():
+            if current_line and current_len + 1 + len(word) > 60:
+                title_parts.append(' '.join(current_line))
                 current_line = [word]
+                current_len = len(word)
+            else:
+                current_len += len(word) + (1 if current_line else 0)
+                current_line.append(word)
         if current_line:
             title_parts.append(' '.join(current_line))
 
@@ -117,6 +167,8 @@ class VisualAbstractGenerator:
         font = self._get_font(self.designer.get_typography().label_size)
         small_font = self._get_font(self.designer.get_typography().small_size)
 
+        text_color = self.designer.get_colors().primary_text
+
         x = section['x'] + 15
         y = section['y'] + 15
         line_height = 20
@@ -124,13 +176,14 @@ class VisualAbstractGenerator:
         # Draw icon if provided
         if icon:
             icon_font = self._get_font(20)
-            draw.text((x, y), icon, font=icon_font, fill=self.designer.get_colors().primary_text)
+            draw.text((x, y), icon, font=icon_font, fill=text_color)
             y += 25
 
         # Draw text lines
         for line in text.split('\n'):
-            if line.strip():
-                draw.text((x, y), line.strip(), font=font, fill=self.designer.get_colors().primary_text)
+            line = line.strip()
+            if line:
+                draw.text((x, y), line, font=font, fill=text_color)
                 y += line_height
 
     def _draw_population_section(self, draw: ImageDraw.ImageDraw) -> None:
@@ -149,10 +202,10 @@ class VisualAbstractGenerator:
 
         lines = [
             f"{icon} POPULATION",
-            f"Total: {int(total):,}" if isinstance(total, (int, float)) else f"Total: {total or 'n/a'}",
-            f"{arm1_label}: {int(arm1_size):,}" if isinstance(arm1_size, (int, float)) else f"{arm1_label}: {arm1_size or 'n/a'}",
-            f"{arm2_label}: {int(arm2_size):,}" if isinstance(arm2_size, (int, float)) else f"{arm2_label}: {arm2_size or 'n/a'}",
-            f"Mean age: {age_mean:.1f} yrs" if isinstance(age_mean, (int, float)) else f"Mean age: {age_mean or 'n/a'}",
+            f"Total: {_fmt_count(total)}",
+            f"{arm1_label}: {_fmt_count(arm1_size)}",
+            f"{arm2_label}: {_fmt_count(arm2_size)}",
+            f"Mean age: {_fmt_num(age_mean, '.1f', ' yrs')}",
         ]
 
         self._draw_text_in_section(draw, "population", "\n".join(lines))
@@ -166,21 +219,23 @@ class VisualAbstractGenerator:
 
         label = outcome.get('label', 'Primary outcome')
         effect = outcome.get('effect_measure') or outcome.get('definition') or ""
-        estimate = outcome.get('estimate') or outcome.get('hazard_ratio')
+        estimate = outcome.get('estimate')
+        if estimate is None:
+            estimate = outcome.get('hazard_ratio')
         ci = outcome.get('ci') or ""
         p_value = outcome.get('p_value', "")
 
         text = f"""{icon} {label}
 Effect: {effect or 'n/a'}
-Estimate: {estimate or 'n/a'}
+Estimate: {_or_na(estimate)}
 CI: {ci or 'n/a'}
-P: {p_value or 'n/a'}"""
+P: {_or_na(p_value)}"""
 
         events = self.trial_data.get('event_rates', {}) if self.trial_data else {}
         arm1 = events.get('arm_1_percent')
         arm2 = events.get('arm_2_percent')
         if arm1 is not None or arm2 is not None:
-            text += f"\nEvents: {arm1 or 'n/a'}% vs {arm2 or 'n/a'}%"
+            text += f"\nEvents: {_or_na(arm1)}% vs {_or_na(arm2)}%"
 
         self._draw_text_in_section(draw, "outcome", text)
 
@@ -210,17 +265,18 @@ P: {p_value or 'n/a'}"""
 
         section = self.designer.get_section("treatment")
         font = self._get_font(self.designer.get_typography().label_size)
+        text_color = self.designer.get_colors().primary_text
         x = section['x'] + 15
         y = section['y'] + 15
 
         # Draw icon
         icon_font = self._get_font(20)
-        draw.text((x, y), icon, font=icon_font, fill=self.designer.get_colors().primary_text)
+        draw.text((x, y), icon, font=icon_font, fill=text_color)
 
         # Draw text
         y += 30
         for line in text.split('\n')[1:]:
-            draw.text((x, y), line.strip(), font=font, fill=self.designer.get_colors().primary_text)
+            draw.text((x, y), line.strip(), font=font, fill=text_color)
             y += 22
 
     def _draw_body_weight_section(self, draw: ImageDraw.ImageDraw) -> None:
@@ -232,12 +288,13 @@ P: {p_value or 'n/a'}"""
         section = self.designer.get_section("body_weight")
         font = self._get_font(self.designer.get_typography().section_header_size)
         label_font = self._get_font(self.designer.get_typography().label_size)
+        text_color = self.designer.get_colors().primary_text
 
         x = section['x'] + 15
         y = section['y'] + 15
 
         # Title
-        draw.text((x, y), "BODY WEIGHT CHANGE", font=font, fill=self.designer.get_colors().primary_text)
+        draw.text((x, y), "BODY WEIGHT CHANGE", font=font, fill=text_color)
         y += 30
 
         # Content
@@ -247,16 +304,16 @@ P: {p_value or 'n/a'}"""
         if isinstance(arm1_change, (int, float)) and isinstance(arm2_change, (int, float)):
             diff = arm1_change - arm2_change
 
-        text = f"Arm 1: {arm1_change:.2f}%" if isinstance(arm1_change, (int, float)) else f"Arm 1: {arm1_change or 'n/a'}"
-        draw.text((x, y), text, font=label_font, fill=self.designer.get_colors().primary_text)
+        text = f"Arm 1: {_fmt_num(arm1_change, '.2f', '%')}"
+        draw.text((x, y), text, font=label_font, fill=text_color)
         y += 25
 
-        text = f"Arm 2: {arm2_change:.2f}%" if isinstance(arm2_change, (int, float)) else f"Arm 2: {arm2_change or 'n/a'}"
-        draw.text((x, y), text, font=label_font, fill=self.designer.get_colors().primary_text)
+        text = f"Arm 2: {_fmt_num(arm2_change, '.2f', '%')}"
+        draw.text((x, y), text, font=label_font, fill=text_color)
         y += 25
 
         text = f"Difference: {diff:.2f} percentage points" if diff is not None else "Difference: n/a"
-        draw.text((x, y), text, font=label_font, fill=self.designer.get_colors().primary_text)
+        draw.text((x, y), text, font=label_font, fill=text_color)
 
     def _draw_conclusion_section(self, draw: ImageDraw.ImageDraw) -> None:
         """Draw conclusion section."""
@@ -271,14 +328,11 @@ P: {p_value or 'n/a'}"""
 
         conclusions = self.trial_data.get('conclusions', []) if self.trial_data else []
         if not conclusions:
-            conclusions = [
-                "✓ Primary outcome favored intervention",
-                "✓ Safety acceptable",
-                "⚠ Review limitations before applying broadly",
-            ]
+            conclusions = DEFAULT_CONCLUSIONS
 
+        text_color = self.designer.get_colors().primary_text
         for conclusion in conclusions:
-            draw.text((x, y), conclusion, font=font, fill=self.designer.get_colors().primary_text)
+            draw.text((x, y), conclusion, font=font, fill=text_color)
             y += line_height
 
     def _draw_footer(self, draw: ImageDraw.ImageDraw) -> None:
@@ -287,10 +341,9 @@ P: {p_value or 'n/a'}"""
         font = self._get_font(self.designer.get_typography().small_size)
         text_color = footer.get('text_color', (150, 150, 150))
 
-        footer_text = "Generated by Medical Visual Abstract System | Data from Semaglutide Trial (NEJM 2023)"
         draw.text(
             (footer['x'] + 10, footer['y'] + 10),
-            footer_text,
+            FOOTER_TEXT,
             font=font,
             fill=text_color
         )
@@ -306,8 +359,7 @@ P: {p_value or 'n/a'}"""
             raise ValueError("No trial data loaded. Call load_trial_data() first.")
 
         # Create image
-        width, height = self.designer.get_image_dimensions()
-        self.image = Image.new('RGB', (width, height),
+        self.image = Image.new(self.target_mode, self.target_size,
                               color=self.designer.get_colors().background)
         draw = ImageDraw.Draw(self.image)
 
@@ -114,27 +114,24 @@ def test_chart_builder(trial_data):
         outcome['semaglutide_rate'],
         outcome['placebo_rate']
     )
-    event_bytes = event_chart.getbuffer().nbytes
+    event_bytes = len(event_chart)
     print(f"  - Size: {event_bytes:,} bytes")
-    event_chart.seek(0)
 
     print("\n✓ Creating body weight chart...")
     weight_chart = builder.create_body_weight_chart(
         bw['semaglutide_change'],
         bw['placebo_change']
     )
-    weight_bytes = weight_chart.getbuffer().nbytes
+    weight_bytes = len(weight_chart)
     print(f"  - Size: {weight_bytes:,} bytes")
-    weight_chart.seek(0)
 
     print("\n✓ Creating population pie chart...")
     pie_chart = builder.create_population_pie_chart(
         pop['drug_arm'],
         pop['placebo_arm']
     )
-    pie_bytes = pie_chart.getbuffer().nbytes
+    pie_bytes = len(pie_chart)
     print(f"  - Size: {pie_bytes:,} bytes")
-    pie_chart.seek(0)
 
     print("\n✓ Generating formatted text:")
     print("\n  Hazard Ratio:")
@@ -0,0 +1,13 @@
+"""Shared assertion helpers for tests."""
+
+from typing import Dict, List
+
+import numpy as np
+
+
+def check_similarities(results: List[Dict]) -> None:
+    """Assert that every result has a similarity score in [0, 1]."""
+    sims = np.fromiter((r["similarity"] for r in results), dtype=np.float64, count=len(results))
+    # Written as a negated range check so NaN scores are reported as invalid too
+    invalid = np.where(~((sims >= 0) & (sims <= 1)))[0]
+    assert invalid.size == 0, f"Invalid similarity at ranks {invalid.tolist()}: {sims[invalid].tolist()}"
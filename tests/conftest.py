@@ -0,0 +1,177 @@
+"""Shared pytest fixtures."""
+
+import base64
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import chromadb
+import httpx
+import matplotlib
+import numpy as np
+import pytest
+import respx
+
+from config import TEST_PDF_PATH, EMBEDDING_DIMENSION, EMBEDDING_MODEL
+
+# Headless backend: avoid GUI backend initialization in chart tests
+matplotlib.use("Agg")
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+QA_RESULTS_PATH = "data/debug_output/qa_results.json"
+
+OPENAI_BASE_URL = "https://api.openai.com/v1"
+PLACEHOLDER_API_KEY = "sk-test-placeholder"
+CANNED_ANSWER = (
+    "The primary cardiovascular outcome was a composite of death from cardiovascular causes, "
+    "nonfatal myocardial infarction, or nonfatal stroke."
+)
+
+
+def _embeddings_snapshot_path() -> Path:
+    """Snapshot file named by a hash of everything the stored vectors depend on.
+
+    Covers the PDF bytes, the chunking code (sizes, overlap, chars-per-token) and
+    the embedding model, so changing any of them points at a new file to build.
+    """
+    import core.pdf_ingest
+
+    digest = hashlib.sha256()
+    for path in (TEST_PDF_PATH, core.pdf_ingest.__file__):
+        digest.update(Path(path).read_bytes())
+    digest.update(f"{EMBEDDING_MODEL}:{EMBEDDING_DIMENSION}".encode("utf-8"))
+    return FIXTURES_DIR / f"test_pdf_embeddings_{digest.hexdigest()[:16]}.npz"
+
+
+def _build_embeddings_snapshot(snapshot_path: Path) -> None:
+    """Chunk and embed TEST_PDF_PATH once and store the result on disk."""
+    from core.embeddings import embed_texts
+    from core.pdf_ingest import pipeline_pdf_to_chunks
+
+    chunks = pipeline_pdf_to_chunks(TEST_PDF_PATH)["chunks"]
+    embeddings = np.asarray(embed_texts(chunks), dtype=np.float32)
+
+    FIXTURES_DIR.mkdir(exist_ok=True)
+    # Write to a temp file first so concurrent xdist workers never read a partial snapshot
+    tmp_path = snapshot_path.with_suffix(f".{os.getpid()}.npz")
+    np.savez_compressed(
+        tmp_path,
+        ids=np.array([f"chunk_{i}" for i in range(len(chunks))]),
+        docs=np.array(chunks),
+        embeddings=embeddings,
+    )
+    os.replace(tmp_path, snapshot_path)
+
+    # Snapshots for older inputs can never be loaded again
+    for stale in FIXTURES_DIR.glob("test_pdf_embeddings*.npz"):
+        if not stale.name.startswith(snapshot_path.stem):
+            stale.unlink(missing_ok=True)
+
+
+@pytest.fixture(scope="session")
+def prebuilt_vectors():
+    """Chunk ids, texts and embeddings for TEST_PDF_PATH, cached in tests/fixtures."""
+    snapshot_path = _embeddings_snapshot_path()
+    if not snapshot_path.exists():
+        _build_embeddings_snapshot(snapshot_path)
+
+    with np.load(snapshot_path) as snapshot:
+        return {
+            "ids": snapshot["ids"].tolist(),
+            "docs": snapshot["docs"].tolist(),
+            "embeddings": snapshot["embeddings"].tolist(),
+        }
+
+
+@pytest.fixture(scope="session")
+def worker_id():
+    """xdist worker name ("gw0", ...), or "master" in a plain serial run; works without pytest-xdist."""
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+@pytest.fixture(scope="session")
+def chroma_client(tmp_path_factory):
+    """One Chroma client per test session, backed by a temporary directory."""
+    return chromadb.PersistentClient(path=str(tmp_path_factory.mktemp("chroma_db")))
+
+
+@pytest.fixture(scope="session")
+def extractor():
+    """Stateless data extractor shared by the whole session."""
+    from utils.data_extraction import TrialDataExtractor
+    return TrialDataExtractor()
+
+
+@pytest.fixture(scope="session")
+def qa_results(extractor):
+    """QA results loaded once per session (treat as read-only)."""
+    return extractor.load_qa_results(QA_RESULTS_PATH)
+
+
+def _fake_embedding(text: str) -> np.ndarray:
+    """Deterministic pseudo-embedding seeded from a hash of the text."""
+    seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "little")
+    return np.random.default_rng(seed).standard_normal(EMBEDDING_DIMENSION).astype(np.float32)
+
+
+def _embeddings_response(request: httpx.Request) -> httpx.Response:
+    """Canned /embeddings response honouring the requested encoding format."""
+    payload = json.loads(request.content)
+    inputs = payload["input"]
+    if isinstance(inputs, str):
+        inputs = [inputs]
+
+    data = []
+    for i, text in enumerate(inputs):
+        vector = _fake_embedding(text)
+        if payload.get("encoding_format") == "base64":
+            embedding = base64.b64encode(vector.tobytes()).decode("ascii")
+        else:
+            embedding = vector.tolist()
+        data.append({"object": "embedding", "index": i, "embedding": embedding})
+
+    return httpx.Response(200, json={
+        "object": "list",
+        "data": data,
+        "model": payload["model"],
+        "usage": {"prompt_tokens": 0, "total_tokens": 0},
+    })
+
+
+def _chat_response(request: httpx.Request) -> httpx.Response:
+    """Canned /chat/completions response."""
+    payload = json.loads(request.content)
+    return httpx.Response(200, json={
+        "id": "chatcmpl-test",
+        "object": "chat.completion",
+        "created": 0,
+        "model": payload["model"],
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": CANNED_ANSWER},
+            "finish_reason": "stop",
+        }],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+    })
+
+
+@pytest.fixture(scope="class")
+def openai_mock():
+    """Serve OpenAI embeddings/chat requests locally for tests that only check structure."""
+    import config
+
+    with pytest.MonkeyPatch.context() as mp, \
+            respx.mock(base_url=OPENAI_BASE_URL, assert_all_called=False) as mock:
+        # core.qa / core.embeddings build OpenAI clients at import, which fails without a key;
+        # no request leaves the mock, so any placeholder will do
+        if not config.OPENAI_API_KEY:
+            mp.setattr(config, "OPENAI_API_KEY", PLACEHOLDER_API_KEY)
+            mp.setenv("OPENAI_API_KEY", PLACEHOLDER_API_KEY)
+        mock.post("/embeddings").mock(side_effect=_embeddings_response)
+        mock.post("/chat/completions").mock(side_effect=_chat_response)
+        yield mock
+
+    # Drop fake query vectors so live tests never see them
+    from core.embeddings import _cached_embed
+    _cached_embed.cache_clear()
@@ -3,6 +3,7 @@
 import pytest
 import os
 from config import TEST_PDF_PATH, OPENAI_API_KEY
+from tests._utils import check_similarities
 
 
 @pytest.mark.skipif(not OPENAI_API_KEY, reason="OpenAI API key not configured")
@@ -10,16 +11,28 @@ class TestRAGPipeline:
     """Test RAG pipeline functionality."""
 
     @pytest.fixture
-    def pipeline(self):
+    def pipeline(self, worker_id, chroma_client):
         """Create a RAG pipeline instance."""
         from core.retrieval import RAGPipeline
-        pipeline = RAGPipeline(collection_name="test_medical_papers")
+        # Each xdist worker gets its own collection to avoid cross-worker contention
+        pipeline = RAGPipeline(collection_name=f"test_medical_papers_{worker_id}", client=chroma_client)
         # Clear any existing data
         pipeline.vector_store.clear_collection()
         yield pipeline
         # Cleanup
         pipeline.vector_store.clear_collection()
 
+    @pytest.fixture
+    def ingested_pipeline(self, pipeline, prebuilt_vectors):
+        """Pipeline loaded with the cached TEST_PDF_PATH embeddings (no embedding calls)."""
+        pipeline.chunks = prebuilt_vectors["docs"]
+        pipeline.vector_store.add_chunks(
+            prebuilt_vectors["docs"],
+            prebuilt_vectors["ids"],
+            embeddings=prebuilt_vectors["embeddings"],
+        )
+        return pipeline
+
     def test_ingest_pdf(self, pipeline):
         """Test PDF ingestion."""
         result = pipeline.ingest_pdf(TEST_PDF_PATH)
@@ -28,79 +41,65 @@ class TestRAGPipeline:
         assert result["num_chunks"] > 0
         assert "metadata" in result
 
-    def test_retrieve_returns_results(self, pipeline):
+    def test_retrieve_returns_results(self, ingested_pipeline):
         """Test that retrieval returns results."""
-        pipeline.ingest_pdf(TEST_PDF_PATH)
-
         query = "primary outcome"
-        results = pipeline.retrieve(query, top_k=5)
+        results = ingested_pipeline.retrieve(query, top_k=5)
 
         assert isinstance(results, list)
         assert len(results) > 0
 
-    def test_retrieve_results_have_required_fields(self, pipeline):
+    def test_retrieve_results_have_required_fields(self, ingested_pipeline):
         """Test that retrieval results have required fields."""
-        pipeline.ingest_pdf(TEST_PDF_PATH)
-
         query = "cardiovascular outcomes"
-        results = pipeline.retrieve(query, top_k=3)
+        results = ingested_pipeline.retrieve(query, top_k=3)
 
         for result in results:
             assert "document" in result
             assert "id" in result
             assert "similarity" in result
             assert isinstance(result["similarity"], float)
+        check_similarities(results)
 
-    def test_retrieve_similarity_scores_are_valid(self, pipeline):
+    def test_retrieve_similarity_scores_are_valid(self, ingested_pipeline):
         """Test that similarity scores are between 0 and 1."""
-        pipeline.ingest_pdf(TEST_PDF_PATH)
-
         query = "trial design"
-        results = pipeline.retrieve(query, top_k=5)
+        results = ingested_pipeline.retrieve(query, top_k=5)
 
-        for result in results:
-            assert 0 <= result["similarity"] <= 1, f"Invalid similarity: {result['similarity']}"
+        check_similarities(results)
 
-    def test_get_context_returns_string(self, pipeline):
+    def test_get_context_returns_string(self, ingested_pipeline):
         """Test that get_context returns concatenated string."""
-        pipeline.ingest_pdf(TEST_PDF_PATH)
-
         query = "methods and results"
-        context = pipeline.get_context(query, top_k=3)
+        context = ingested_pipeline.get_context(query, top_k=3)
 
         assert isinstance(context, str)
         assert len(context) > 0
 
-    def test_get_retrieval_stats(self, pipeline):
+    def test_get_retrieval_stats(self, ingested_pipeline):
         """Test retrieval statistics."""
-        pipeline.ingest_pdf(TEST_PDF_PATH)
-
         query = "patient population"
-        stats = pipeline.get_retrieval_stats(query, top_k=5)
+        stats = ingested_pipeline.get_retrieval_stats(query, top_k=5)
 
         assert "query" in stats
         assert "num_results" in stats
         assert "results" in stats
         assert len(stats["results"]) > 0
 
-    def test_collection_info(self, pipeline):
+    def test_collection_info(self, ingested_pipeline):
         """Test getting collection information."""
-        pipeline.ingest_pdf(TEST_PDF_PATH)
-
-        info = pipeline.get_collection_info()
+        info = ingested_pipeline.get_collection_info()
 
         assert "collection_name" in info
         assert "num_documents" in info
         assert "embedding_dimension" in info
         assert info["num_documents"] > 0
 
-    def test_retrieval_relevance(self, pipeline):
+    def test_retrieval_relevance(self, ingested_pipeline):
         """Test that retrieval returns relevant results."""
-        pipeline.ingest_pdf(TEST_PDF_PATH)
-
         # Query about primary outcome
         query = "What was the primary cardiovascular outcome?"
-        results = pipeline.retrieve(query, top_k=1)
+        results = ingested_pipeline.retrieve(query, top_k=1)
 
         # Top result should have high similarity
         assert results[0]["similarity"] > 0.5, "Top result has low similarity"
@@ -113,16 +112,17 @@ class TestRAGPipeline:
 class TestVectorStore:
     """Test vector store functionality."""
 
-    def test_vector_store_creation(self):
+    def test_vector_store_creation(self, worker_id, chroma_client):
         """Test vector store creation."""
+        collection_name = f"test_store_{worker_id}"
         try:
             from core.vector_store import VectorStore
-            store = VectorStore(collection_name="test_store")
+            store = VectorStore(collection_name=collection_name, client=chroma_client)
         except ValueError:
             # Skip if API key is not configured
             pytest.skip("OpenAI API key not configured")
         assert store is not None
-        assert store.collection_name == "test_store"
+        assert store.collection_name == collection_name
 
 
 if __name__ == "__main__":
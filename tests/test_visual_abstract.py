@@ -2,27 +2,46 @@
 
 import pytest
 import json
+import re
 from pathlib import Path
 from PIL import Image
 from config import OPENAI_API_KEY
 
-# Skip all tests if API key not configured
-pytestmark = pytest.mark.skipif(not OPENAI_API_KEY, reason="OpenAI API key not configured")
+requires_api_key = pytest.mark.skipif(not OPENAI_API_KEY, reason="OpenAI API key not configured")
 
 
-class TestDataExtraction:
-    """Test data extraction module."""
+@pytest.fixture(scope="module")
+def generator():
+    """Create a generator instance shared by tests that only read its state."""
+    from core.visual_abstract import VisualAbstractGenerator
+    return VisualAbstractGenerator("data/debug_output/qa_results.json")
 
-    @pytest.fixture
-    def extractor(self):
-        """Create data extractor instance."""
-        from utils.data_extraction import TrialDataExtractor
-        return TrialDataExtractor()
 
-    @pytest.fixture
-    def qa_results(self, extractor):
-        """Load QA results."""
-        return extractor.load_qa_results('data/debug_output/qa_results.json')
+@pytest.fixture(scope="module")
+def rendered(generator):
+    """Render the shared generator's infographic once for all tests that need pixels."""
+    return generator.generate_abstract()
+
+
+_EXTRACT_CASES = [
+    ("demographics", {"total_enrolled": 17604, "drug_arm": 8803, "placebo_arm": 8801}),
+    ("outcomes", {"hazard_ratio": 0.8, "ci_lower": 0.72, "ci_upper": 0.9, "p_value": "<0.001"}),
+    ("adverse_events", {"discontinuation": {"drug": 16.6, "placebo": 8.2}}),
+    ("dosing", {"dose": "2.4 mg", "frequency": "weekly", "at_target_percent": 77.0}),
+    ("body_weight", {"semaglutide_change": -9.39, "placebo_change": -0.88}),
+]
+
+
+def _qa_with_answer(index, answer):
+    """QA results with one answer set and the other six empty."""
+    results = [{"question": "", "answer": ""} for _ in range(7)]
+    results[index]["answer"] = answer
+    return {"results": results}
+
+
+@pytest.mark.offline
+class TestDataExtraction:
+    """Test data extraction module."""
 
     def test_extractor_initialization(self, extractor):
         """Test extractor can be initialized."""
@@ -35,37 +54,101 @@ class TestDataExtraction:
         assert 'results' in qa_results
         assert len(qa_results['results']) == 7
 
-    def test_extract_demographics(self, extractor, qa_results):
-        """Test demographic extraction."""
-        demo = extractor.extract_demographics(qa_results)
-
-        assert demo['total_enrolled'] == 17604
-        assert demo['drug_arm'] == 8803
-        assert demo['placebo_arm'] == 8801
-
-    def test_extract_outcomes(self, extractor, qa_results):
-        """Test outcome extraction."""
+    def test_loaded_results_are_independent(self, extractor):
+        """Test each load returns its own copy, however the path is spelled."""
+        first = extractor.load_qa_results('data/debug_output/qa_results.json')
+        first['results'].clear()
+
+        assert len(extractor.load_qa_results('./data/debug_output/qa_results.json')['results']) == 7
+
+    @pytest.mark.parametrize("field,expected", _EXTRACT_CASES, ids=[c[0] for c in _EXTRACT_CASES])
+    def test_extract(self, extractor, qa_results, field, expected):
+        """Test each extract_* method against known values."""
+        result = getattr(extractor, f"extract_{field}")(qa_results)
+
+        for key, value in expected.items():
+            assert result[key] == value, f"{field}.{key}"
+
+    @pytest.mark.parametrize("answer,expected", [
+        # Arm counts before the total: the total is the first "<n> patients", even an arm count
+        ("8,803 patients assigned to receive semaglutide and 8,801 patients assigned to receive placebo",
+         (8803, 8803, 8801)),
+        # Singular arm phrase is not a total; the later plural count is
+        ("1 patient to receive placebo; 17,604 patients enrolled", (17604, 0, 1)),
+    ])
+    def test_enrollment_counts(self, extractor, answer, expected):
+        """Test the single enrollment sweep keeps the first total and first count per arm."""
+        demographics = extractor.extract_demographics(_qa_with_answer(1, answer))
+
+        assert (demographics['total_enrolled'], demographics['drug_arm'], demographics['placebo_arm']) == expected
+
+    @pytest.mark.parametrize("answer,expected", [
+        # (serious AE event rates, serious AE arm rates, body weight change)
+        # Gaps stay on one line: the body weight values split by a newline are not paired
+        ("Serious adverse events: 33.4% vs 36.4%. Body weight: semaglutide\n-5%, placebo -1%.",
+         ((33.4, 36.4), (6.5, 1.0), (-9.39, -0.88))),
+        # ...and span at most 120 chars
+        ("Serious adverse events" + " ." * 61 + " 10% vs 12%", ((6.5, 8.0), (6.5, 8.0), (-9.39, -0.88))),
+        ("Serious adverse events" + " ." * 59 + " 10% vs 12%", ((10.0, 12.0), (6.5, 8.0), (-9.39, -0.88))),
+        ("Semaglutide reduced body weight (semaglutide -8%, placebo -1%); "
+         "serious adverse events: semaglutide 20.1%, placebo 22.2%",
+         ((20.1, 22.2), (8.0, 1.0), (-8.0, -1.0))),
+        # Arm rates inside the serious adverse events span are still found
+        ("Serious adverse events: semaglutide 20.1%, placebo 22.2%", ((20.1, 22.2), (20.1, 22.2), (-9.39, -0.88))),
+    ])
+    def test_comparison_sweep(self, extractor, answer, expected):
+        """Test the fused comparison sweep feeds outcomes, serious adverse events and body weight."""
+        qa_results = _qa_with_answer(6, answer)
         outcomes = extractor.extract_outcomes(qa_results)
-
-        assert outcomes['hazard_ratio'] == 0.8
-        assert outcomes['ci_lower'] == 0.72
-        assert outcomes['ci_upper'] == 0.9
-        assert outcomes['p_value'] == '<0.001'
-
-    def test_extract_adverse_events(self, extractor, qa_results):
-        """Test adverse event extraction."""
-        ae = extractor.extract_adverse_events(qa_results)
-
-        assert ae['discontinuation']['drug'] == 16.6
-        assert ae['discontinuation']['placebo'] == 8.2
-
-    def test_extract_dosing(self, extractor, qa_results):
-        """Test dosing extraction."""
-        dosing = extractor.extract_dosing(qa_results)
-
-        assert dosing['dose'] == '2.4 mg'
-        assert dosing['frequency'] == 'weekly'
-        assert dosing['at_target_percent'] == 77.0
+        serious = extractor.extract_adverse_events(qa_results)['serious_adverse']
+        body_weight = extractor.extract_body_weight(qa_results)
+
+        assert (outcomes['semaglutide_rate'], outcomes['placebo_rate']) == expected[0]
+        assert (serious['drug'], serious['placebo']) == expected[1]
+        assert (body_weight['semaglutide_change'], body_weight['placebo_change']) == expected[2]
+
+    def test_extraction_patterns_run_on_re2(self):
+        """Test every extraction pattern compiles under RE2 when it is installed, none falling back to re."""
+        pytest.importorskip("re2")
+        from utils import data_extraction as de
+
+        patterns = [de._ENROLLMENT_RE, de._AGE_RE, de._HR_CI_RE]
+        patterns += [de._alternation(tuple(branches.items()))
+                     for branches in (de._GI_ARM_RATE_BRANCHES, de._COMPARISON_BRANCHES)]
+
+        assert [type(p).__module__ for p in patterns] == ['re2'] * len(patterns)
+
+    def test_patterns_match_stdlib_re(self, extractor, qa_results):
+        """Test every self.patterns entry extracts the same values as plain re on the sample answers."""
+        for key, pattern in extractor.patterns.items():
+            reference = re.compile(pattern, re.IGNORECASE)
+            for result in qa_results['results']:
+                assert (extractor.extract_number(result['answer'], pattern)
+                        == extractor.extract_number(result['answer'], reference)), key
+
+    @pytest.mark.parametrize("text,pattern,expected", [
+        ("17,604 patients", r'(\d+(?:,\d+)*)\s+patients', 17604.0),  # single group, comma stripped
+        ("age: 55", r'(\d+)\s+years?|age[:\s]+(\d+)', 55.0),  # two groups, only the second participates
+        ("p = <0.001", r'p\s*=\s*(<?\s*0\.0*)?(\d+)', 1.0),  # first group is not numeric, so the next is used
+        ("dose 2.4 mg", re.compile(r'dose\s+(\d+(?:\.\d+)?)'), 2.4),
+        ("n = 12", r'N = (\d+)', 12.0),  # raw regex string, case-insensitive
+    ])
+    def test_extract_number(self, extractor, text, pattern, expected):
+        """Test extract_number for single- and multi-group, compiled and raw regex patterns."""
+        assert extractor.extract_number(text, pattern) == expected
+
+    @pytest.mark.parametrize("index,answer,field,path,expected", [
+        (3, "0% reached the target dose", "dosing", ("at_target_percent",), 0.0),
+        (6, "placebo 0%", "adverse_events", ("serious_adverse", "placebo"), 0.0),
+        (6, "Body weight: semaglutide 0%, placebo 0%", "body_weight", ("placebo_change",), 0.0),
+    ], ids=["dosing", "serious_ae", "body_weight"])
+    def test_extracted_zero_is_kept(self, extractor, index, answer, field, path, expected):
+        """Test an extracted 0 is returned as-is rather than replaced by the fallback default."""
+        value = getattr(extractor, f"extract_{field}")(_qa_with_answer(index, answer))
+        for key in path:
+            value = value[key]
+
+        assert value == expected
 
     def test_extract_key_metrics(self, extractor, qa_results):
         """Test complete metric extraction."""
@@ -78,6 +161,7 @@ class TestDataExtraction:
         assert 'adverse_events' in trial_data
 
 
+@pytest.mark.offline
 class TestLayoutDesigner:
     """Test layout designer module."""
 
@@ -107,6 +191,8 @@ class TestLayoutDesigner:
                            "treatment", "body_weight", "conclusion", "footer"]
         for section_name in expected_sections:
             assert section_name in sections
+        # Plain dicts, so callers can serialise or modify them
+        assert json.loads(json.dumps(sections))["header"]["x"] == 40
 
     def test_get_section_properties(self, designer):
         """Test section properties."""
@@ -118,6 +204,17 @@ class TestLayoutDesigner:
         assert 'height' in population_section
         assert 'bg_color' in population_section
 
+    def test_sections_follow_dimensions(self, designer):
+        """Test sections are laid out from the designer's own dimensions."""
+        from utils.layout_designer import Dimensions, LayoutDesigner
+
+        designer.dims = Dimensions(width=2000)
+        designer.sections = designer._define_sections()
+
+        assert designer.get_section("header")["width"] == 2000 - 2 * designer.dims.margin
+        # Other designers keep the shared default layout
+        assert LayoutDesigner().get_section("header")["width"] == 1400 - 2 * designer.dims.margin
+
     def test_get_colors(self, designer):
         """Test color scheme."""
         colors = designer.get_colors()
@@ -134,7 +231,15 @@ class TestLayoutDesigner:
         assert typo.section_header_size == 16
         assert typo.label_size == 13
 
+    def test_all_layout_types_build(self):
+        """Test every advertised layout type can be constructed."""
+        from utils.layout_designer import LayoutDesigner, LAYOUT_TYPES
+
+        for layout_type in LAYOUT_TYPES:
+            assert "header" in LayoutDesigner(layout_type).get_all_sections()
+
 
+@pytest.mark.offline
 class TestChartBuilder:
     """Test chart builder module."""
 
@@ -142,7 +247,7 @@ class TestChartBuilder:
     def builder(self):
         """Create chart builder instance."""
         from utils.chart_builder import ChartBuilder
-        return ChartBuilder()
+        return ChartBuilder(fast_mode=True)
 
     def test_builder_initialization(self, builder):
         """Test builder initialization."""
@@ -154,24 +259,29 @@ class TestChartBuilder:
         chart = builder.create_event_rate_chart(6.5, 8.0)
 
         assert chart is not None
-        chart_bytes = chart.getbuffer().nbytes
-        assert chart_bytes > 0
+        assert chart[:4] == b'\x89PNG'
 
     def test_create_body_weight_chart(self, builder):
         """Test body weight chart creation."""
         chart = builder.create_body_weight_chart(-9.39, -0.88)
 
         assert chart is not None
-        chart_bytes = chart.getbuffer().nbytes
-        assert chart_bytes > 0
+        assert chart[:4] == b'\x89PNG'
 
     def test_create_population_pie_chart(self, builder):
         """Test population pie chart creation."""
         chart = builder.create_population_pie_chart(8803, 8801)
 
         assert chart is not None
-        chart_bytes = chart.getbuffer().nbytes
-        assert chart_bytes > 0
+        assert chart[:4] == b'\x89PNG'
+
+    def test_build_all(self, builder, extractor, qa_results):
+        """Test all charts are built from extracted trial data."""
+        charts = builder.build_all(extractor.extract_key_metrics(qa_results))
+
+        assert set(charts) == {"event_rate", "body_weight", "population"}
+        for png_bytes in charts.values():
+            assert png_bytes[:4] == b'\x89PNG'
 
     def test_format_hazard_ratio_text(self, builder):
         """Test hazard ratio text formatting."""
@@ -198,14 +308,38 @@ class TestChartBuilder:
         assert "Discontinuation" in text
 
 
-class TestVisualAbstractGenerator:
-    """Test visual abstract generator module."""
+@pytest.mark.offline
+class TestGeneratorOffline:
+    """Test visual abstract generator behaviour that needs neither the QA sample nor an API key."""
 
-    @pytest.fixture
-    def generator(self):
-        """Create generator instance."""
+    def test_chart_builder_created_on_demand(self):
+        """Test the chart builder is only constructed when first accessed."""
+        from core.visual_abstract import VisualAbstractGenerator
+
+        gen = VisualAbstractGenerator(trial_data={"trial_info": {}})
+        assert gen._builder is None
+        assert gen.builder is gen.builder
+
+    @pytest.mark.parametrize("trial_data", [
+        {"trial_info": {}},
+        {"trial_info": {"title": "Partial"}, "population": {"total_enrolled": 100}},
+        {"trial_info": {}, "primary_outcome": {}, "adverse_events": {}, "body_weight": {"semaglutide_change": None}},
+    ], ids=["trial_info_only", "population_only", "empty_sections"])
+    def test_pipeline_with_missing_data(self, trial_data):
+        """Test pipeline renders and exports when sections or fields are missing."""
         from core.visual_abstract import VisualAbstractGenerator
-        return VisualAbstractGenerator("data/debug_output/qa_results.json")
+
+        gen = VisualAbstractGenerator(trial_data=trial_data)
+        image = gen.generate_abstract()
+
+        assert image.size == (1400, 1800)
+        assert image.mode == 'RGB'
+        assert gen.export_as_bytes()[:4] == b'\x89PNG'
+
+
+@requires_api_key
+class TestVisualAbstractGenerator:
+    """Test visual abstract generator module."""
 
     def test_generator_initialization(self, generator):
         """Test generator initialization."""
@@ -217,18 +351,20 @@ class TestVisualAbstractGenerator:
         assert generator.trial_data['trial_info']['title'] is not None
         assert generator.trial_data['population']['total_enrolled'] > 0
 
-    def test_generate_abstract(self, generator):
-        """Test infographic generation."""
-        image = generator.generate_abstract()
+    def test_target_size_and_mode(self, generator):
+        """Test output geometry is known without rendering."""
+        assert generator.target_size == (1400, 1800)
+        assert generator.target_mode == 'RGB'
 
-        assert image is not None
-        assert isinstance(image, Image.Image)
-        assert image.size == (1400, 1800)
-        assert image.mode == 'RGB'
+    def test_generate_abstract(self, generator, rendered):
+        """Test infographic generation."""
+        assert rendered is not None
+        assert isinstance(rendered, Image.Image)
+        assert rendered.size == generator.target_size
+        assert rendered.mode == generator.target_mode
 
-    def test_export_as_png(self, generator, tmp_path):
+    def test_export_as_png(self, generator, rendered, tmp_path):
         """Test PNG export."""
-        image = generator.generate_abstract()
         output_path = tmp_path / "test_abstract.png"
 
         generator.export_as_png(str(output_path))
@@ -236,9 +372,8 @@ class TestVisualAbstractGenerator:
         assert output_path.exists()
         assert output_path.stat().st_size > 0
 
-    def test_export_as_bytes(self, generator):
+    def test_export_as_bytes(self, generator, rendered):
         """Test bytes export."""
-        image = generator.generate_abstract()
         png_bytes = generator.export_as_bytes()
 
         assert png_bytes is not None
@@ -246,48 +381,30 @@ class TestVisualAbstractGenerator:
         # PNG files start with magic bytes
         assert png_bytes[:4] == b'\x89PNG'
 
-    def test_get_image(self, generator):
+    def test_get_image(self, generator, rendered):
         """Test get_image method."""
-        image = generator.generate_abstract()
         retrieved_image = generator.get_image()
 
         assert retrieved_image is not None
-        assert retrieved_image.size == image.size
+        assert retrieved_image.size == rendered.size
 
 
+@requires_api_key
 class TestIntegration:
     """Integration tests for full pipeline."""
 
-    def test_full_pipeline(self):
+    def test_full_pipeline(self, generator, rendered):
         """Test complete pipeline from data to image."""
-        from core.visual_abstract import VisualAbstractGenerator
-
-        # Initialize
-        generator = VisualAbstractGenerator("data/debug_output/qa_results.json")
-
-        # Generate
-        image = generator.generate_abstract()
-
         # Verify
-        assert image is not None
-        assert image.size == (1400, 1800)
-        assert image.mode == 'RGB'
+        assert rendered is not None
+        assert rendered.size == (1400, 1800)
+        assert rendered.mode == 'RGB'
 
         # Export
         png_bytes = generator.export_as_bytes()
         assert len(png_bytes) > 0
         assert png_bytes[:4] == b'\x89PNG'
 
-    def test_pipeline_with_missing_data(self):
-        """Test pipeline handles missing data gracefully."""
-        from core.visual_abstract import VisualAbstractGenerator
-
-        # This should not crash even if data is incomplete
-        generator = VisualAbstractGenerator("data/debug_output/qa_results.json")
-        image = generator.generate_abstract()
-
-        assert image is not None
-
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,30 +1,91 @@
 """Chart building module for creating simple visualizations."""
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from io import BytesIO
-from typing import Dict, Any, Tuple, List
-import numpy as np
+from PIL import Image
+from typing import TYPE_CHECKING, Dict, Any, Tuple, List
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
+# Fixed margins for the 6x4in charts; tight_layout re-measures every text artist per chart
+_SUBPLOT_MARGINS = {'left': 0.12, 'right': 0.98, 'top': 0.92, 'bottom': 0.12}
+_PIE_MARGINS = {'left': 0.02, 'right': 0.98, 'top': 0.85, 'bottom': 0.04}
+
+
+def _build_chart(fast_mode: bool, high_res: bool, method: str, args: Tuple) -> bytes:
+    """Worker entry point: render one chart in a fresh process and return its PNG bytes."""
+    return getattr(ChartBuilder(fast_mode=fast_mode, high_res=high_res), method)(*args)
 
 
 class ChartBuilder:
     """Build simple charts for infographic."""
 
-    def __init__(self):
-        """Initialize chart builder."""
+    # matplotlib classes, imported on first chart so text-only use skips the import
+    _figure_cls = None
+    _canvas_cls = None
+
+    def __init__(self, fast_mode: bool = False, high_res: bool = False):
+        """
+        Initialize chart builder.
+
+        Args:
+            fast_mode: Skip PNG compression (larger output, faster export)
+            high_res: Render at 100 dpi for print instead of the 72 dpi preview default
+        """
         self.drug_color = (31, 119, 180)  # Blue (0-255 scale)
         self.placebo_color = (255, 127, 14)  # Orange (0-255 scale)
         self.drug_color_norm = tuple(c / 255 for c in self.drug_color)  # Normalized for matplotlib
         self.placebo_color_norm = tuple(c / 255 for c in self.placebo_color)
-
-    def _create_figure(self, figsize: Tuple[float, float] = (8, 4)) -> Tuple[plt.Figure, plt.Axes]:
-        """Create matplotlib figure with white background."""
-        fig, ax = plt.subplots(figsize=figsize, dpi=100)
-        fig.patch.set_facecolor('white')
+        self.fast_mode = fast_mode
+        self.high_res = high_res
+        # 72 dpi rasterizes about half the pixels of 100 dpi; text sizes are in points so layout is unchanged
+        self.dpi = 100 if high_res else 72
+
+        # One standalone Figure + Agg canvas, created on the first chart and reused (not tracked by pyplot)
+        self._fig = None
+        self._canvas = None
+
+    @classmethod
+    def _mpl(cls) -> Tuple[type, type]:
+        """Import matplotlib's Figure and Agg canvas classes on first call."""
+        if cls._figure_cls is None:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+            cls._figure_cls, cls._canvas_cls = Figure, FigureCanvasAgg
+        return cls._figure_cls, cls._canvas_cls
+
+    def _create_figure(self, figsize: Tuple[float, float] = (8, 4)) -> Tuple['Figure', 'Axes']:
+        """Clear the shared figure and give it a fresh white axes."""
+        if self._fig is None:
+            figure_cls, canvas_cls = self._mpl()
+            self._fig = figure_cls(figsize=(6, 4), dpi=self.dpi)
+            self._canvas = canvas_cls(self._fig)
+            self._fig.patch.set_facecolor('white')
+
+        fig = self._fig
+        fig.clear()
+        if tuple(fig.get_size_inches()) != tuple(figsize):
+            fig.set_size_inches(figsize)
+        ax = fig.add_subplot(111)
         ax.patch.set_facecolor('white')
         return fig, ax
 
-    def create_event_rate_chart(self, semaglutide_rate: float, placebo_rate: float) -> BytesIO:
+    def _save_figure(self, fig: 'Figure') -> bytes:
+        """Rasterize figure on its Agg canvas and encode it as PNG bytes."""
+        canvas = fig.canvas
+        canvas.draw()
+        image = Image.frombuffer('RGBA', canvas.get_width_height(), canvas.buffer_rgba(), 'raw', 'RGBA', 0, 1)
+
+        # zlib compression dominates PNG export time; level 1 is near-free, fast mode skips it
+        buffer = BytesIO()
+        image.save(buffer, format='PNG', compress_level=0 if self.fast_mode else 1)
+
+        return buffer.getvalue()
+
+    def create_event_rate_chart(self, semaglutide_rate: float, placebo_rate: float) -> bytes:
         """
         Create side-by-side bar chart for event rates.
 
@@ -33,7 +94,7 @@ class ChartBuilder:
             placebo_rate: Event rate for placebo (percentage)
 
         Returns:
-            BytesIO object containing chart image
+            PNG bytes of the chart image
         """
         fig, ax = self._create_figure((6, 4))
 
@@ -56,17 +117,11 @@ class ChartBuilder:
         ax.spines['right'].set_visible(False)
         ax.grid(axis='y', alpha=0.3, linestyle='--')
 
-        plt.tight_layout()
-
-        # Save to bytes
-        buffer = BytesIO()
-        plt.savefig(buffer, format='png', dpi=100, bbox_inches='tight', facecolor='white')
-        buffer.seek(0)
-        plt.close(fig)
+        fig.subplots_adjust(**_SUBPLOT_MARGINS)
 
-        return buffer
+        return self._save_figure(fig)
 
-    def create_body_weight_chart(self, semaglutide_change: float, placebo_change: float) -> BytesIO:
+    def create_body_weight_chart(self, semaglutide_change: float, placebo_change: float) -> bytes:
         """
         Create bar chart for body weight changes.
 
@@ -75,7 +130,7 @@ class ChartBuilder:
             placebo_change: Weight change for placebo (percentage)
 
         Returns:
-            BytesIO object containing chart image
+            PNG bytes of the chart image
         """
         fig, ax = self._create_figure((6, 4))
 
@@ -100,17 +155,11 @@ class ChartBuilder:
         ax.spines['right'].set_visible(False)
         ax.grid(axis='y', alpha=0.3, linestyle='--')
 
-        plt.tight_layout()
+        fig.subplots_adjust(**_SUBPLOT_MARGINS)
 
-        # Save to bytes
-        buffer = BytesIO()
-        plt.savefig(buffer, format='png', dpi=100, bbox_inches='tight', facecolor='white')
-        buffer.seek(0)
-        plt.close(fig)
+        return self._save_figure(fig)
 
-        return buffer
-
-    def create_population_pie_chart(self, drug_count: int, placebo_count: int) -> BytesIO:
+    def create_population_pie_chart(self, drug_count: int, placebo_count: int) -> bytes:
         """
         Create simple pie chart for population breakdown.
 
@@ -119,7 +168,7 @@ class ChartBuilder:
             placebo_count: Number of patients in placebo arm
 
         Returns:
-            BytesIO object containing chart image
+            PNG bytes of the chart image
         """
         fig, ax = self._create_figure((6, 4))
 
@@ -138,15 +187,40 @@ class ChartBuilder:
 
         ax.set_title('Population Distribution', fontsize=12, fontweight='bold', pad=20)
 
-        plt.tight_layout()
+        fig.subplots_adjust(**_PIE_MARGINS)
 
-        # Save to bytes
-        buffer = BytesIO()
-        plt.savefig(buffer, format='png', dpi=100, bbox_inches='tight', facecolor='white')
-        buffer.seek(0)
-        plt.close(fig)
+        return self._save_figure(fig)
+
+    def build_all(self, trial_data: Dict[str, Any], parallel: bool = False) -> Dict[str, bytes]:
+        """
+        Build all three charts for a trial.
 
-        return buffer
+        Args:
+            trial_data: Extracted trial data (see TrialDataExtractor.extract_key_metrics)
+            parallel: Render each chart in its own spawned worker process. Worker
+                startup (importing matplotlib) outweighs the render for one trial,
+                so this only pays off when the pool time is amortized
+
+        Returns:
+            Dict mapping chart name ('event_rate', 'body_weight', 'population') to PNG bytes
+        """
+        outcome = trial_data['primary_outcome']
+        weight = trial_data['body_weight']
+        population = trial_data['population']
+        jobs = {
+            'event_rate': ('create_event_rate_chart', (outcome['semaglutide_rate'], outcome['placebo_rate'])),
+            'body_weight': ('create_body_weight_chart', (weight['semaglutide_change'], weight['placebo_change'])),
+            'population': ('create_population_pie_chart', (population['drug_arm'], population['placebo_arm'])),
+        }
+
+        if not parallel:
+            return {name: getattr(self, method)(*args) for name, (method, args) in jobs.items()}
+
+        # matplotlib is not thread-safe, so charts render in separate spawned processes
+        with ProcessPoolExecutor(max_workers=len(jobs), mp_context=multiprocessing.get_context('spawn')) as pool:
+            futures = {name: pool.submit(_build_chart, self.fast_mode, self.high_res, method, args)
+                       for name, (method, args) in jobs.items()}
+            return {name: future.result() for name, future in futures.items()}
 
     def format_hazard_ratio_text(self, hr: float, ci_lower: float, ci_upper: float, p_value: str) -> str:
         """
@@ -200,11 +274,7 @@ BMI Requirement:     ≥{bmi}
 """
         return text
 
-    def save_chart_to_file(self, buffer: BytesIO, filepath: str) -> None:
-        """Save chart buffer to file."""
+    def save_chart_to_file(self, data: bytes, filepath: str) -> None:
+        """Save chart PNG bytes to file."""
         with open(filepath, 'wb') as f:
-            f.write(buffer.getvalue())
-
-    def get_chart_bytes(self, buffer: BytesIO) -> bytes:
-        """Get chart as bytes."""
-        return buffer.getvalue()
+            f.write(data)
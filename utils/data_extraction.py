@@ -1,8 +1,187 @@
 """Data extraction module for parsing QA answers into structured trial data."""
 
-import re
+import copy
 import json
-from typing import Dict, Any, Optional
+import logging
+import os
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Pattern, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+try:
+    import re2
+except ImportError:  # pragma: no cover - google-re2 is an optional linear-time engine
+    re2 = None
+
+logger = logging.getLogger(__name__)
+
+
+def _compile(pattern: str, flags: int = 0):
+    """Compile pattern with RE2 when installed, else (or for syntax RE2 lacks, e.g. lookahead) with re.
+
+    Only re.IGNORECASE and re.DOTALL are translated for RE2. Both engines
+    expose the same search/finditer/group API used by the extractor. Under
+    RE2 the digit and whitespace classes are ASCII-only, whereas re also
+    matches other Unicode digits and spaces (e.g. Arabic-Indic digits or a
+    no-break space), so such text may extract differently with RE2 installed.
+    """
+    if re2 is not None:
+        options = re2.Options()
+        options.case_sensitive = not flags & re.IGNORECASE
+        options.dot_nl = bool(flags & re.DOTALL)
+        options.log_errors = False
+        try:
+            return re2.compile(pattern, options)
+        except re2.error:
+            logger.info(f"RE2 cannot compile {pattern!r}; using re")
+    return re.compile(pattern, flags)
+
+
+@lru_cache(maxsize=8)
+def _read_json(filepath: str, mtime_ns: int, size: int) -> Dict:
+    """Parse a JSON file; the stat fields in the key invalidate stale entries.
+
+    The result is shared by every later hit, so callers copy it before handing it out.
+    """
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+# Ad-hoc patterns used by the extract_* methods, compiled once (the branch tables on first use,
+# by _alternation). None uses lookaround, so all of them run on RE2 when it is installed. Every
+# gap between anchors stays on one line and spans at most 120 chars ([^\n]{0,120}?), and a gap
+# right before a captured percentage also never skips another one ([^%\n]{0,120}?). A failed
+# search so stays near-linear under re instead of backtracking across the whole answer; values
+# split across lines or further apart fall back to the defaults.
+# "<count> patients" (total) and "<count> patient(s) [assigned] to receive <arm>" in one pattern.
+# A match holds no digits past its count, so consuming finditer still finds the first of each
+_ENROLLMENT_RE = _compile(
+    r'(?P<count>\d+(?:,\d+)*)\s+patient(?P<plural>s)?'
+    r'(?:\s+(?:assigned\s+)?to receive (?P<arm>semaglutide|placebo))?',
+    re.IGNORECASE
+)
+_AGE_RE = _compile(r'(\d+)\s+years? of age', re.IGNORECASE)
+_HR_CI_RE = _compile(r'(\d+(?:\.\d+)?)\s*\(95%\s*CI[,\s]*(\d+(?:\.\d+)?)[–\-](\d+(?:\.\d+)?)\)')
+# First GI rate after each arm, read by _first_matches
+_GI_ARM_RATE_BRANCHES = {
+    'semaglutide': r'semaglutide\s+arm[^%\n]{0,120}?(?P<semaglutide_rate>\d+(?:\.\d+)?)%',
+    'placebo': r'placebo\s+arm[^%\n]{0,120}?(?P<placebo_rate>\d+(?:\.\d+)?)%',
+}
+# Everything read from the comparison answer, one alternative per value. Each alternative starts
+# with a distinct literal, so at most one can match at any position.
+_COMPARISON_BRANCHES = {
+    'serious_ae': r'serious\s+adverse\s+events[^%\n]{0,120}?(?P<sae_drug>\d+(?:\.\d+)?)%'
+                  r'[^%\n]{0,120}?(?P<sae_placebo>\d+(?:\.\d+)?)%',
+    'semaglutide': r'semaglutide[^%\n]{0,120}?(?P<semaglutide_rate>\d+(?:\.\d+)?)%',
+    'placebo': r'placebo[^%\n]{0,120}?(?P<placebo_rate>\d+(?:\.\d+)?)%',
+    'body_weight': r'body\s+weight[^\n]{0,120}?semaglutide[^%\n]{0,120}?(?P<bw_drug>-?\d+(?:\.\d+)?)%'
+                   r'[^\n]{0,120}?placebo[^%\n]{0,120}?(?P<bw_placebo>-?\d+(?:\.\d+)?)%',
+}
+
+
+@lru_cache(maxsize=32)
+def _alternation(branches: Tuple[Tuple[str, str], ...]) -> Pattern:
+    """Consuming alternation of (name, pattern) branches, each wrapped in a group with its name."""
+    return _compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in branches), re.IGNORECASE)
+
+
+def _first_matches(text: str, branches: Mapping[str, str]) -> Dict[str, Any]:
+    """First match of each branch in text, keyed by branch name; branches never found are left out.
+
+    Branches must start with distinct literals, so at most one matches at any
+    position. A branch's match may contain the start of another (e.g.
+    "semaglutide and placebo: 5% vs 4%"), so each search resumes one character
+    past the last hit and looks only for the branches still missing: the
+    first hit per branch equals a separate search for it, in at most
+    len(branches) + 1 searches.
+    """
+    found = {}
+    remaining = tuple(branches)
+    pos = 0
+    while remaining:
+        match = _alternation(tuple((name, branches[name]) for name in remaining)).search(text, pos)
+        if match is None:
+            break
+        # Each branch's group encloses its captures and so closes last: lastgroup names the branch
+        name = match.lastgroup
+        found[name] = match
+        remaining = tuple(n for n in remaining if n != name)
+        pos = match.start() + 1
+    return found
+
+
+@lru_cache(maxsize=32)
+def _scan_comparison(text: str) -> Mapping[str, Any]:
+    """Read serious-AE rates, per-arm rates and body-weight changes from the comparison answer.
+
+    Keys present only when found: 'serious_ae' and 'body_weight' map to
+    (semaglutide, placebo) float pairs, 'semaglutide'/'placebo' to the first
+    rate after each arm name. Cached per text, hence returned read-only.
+    """
+    found = {}
+    for name, match in _first_matches(text, _COMPARISON_BRANCHES).items():
+        if name == 'serious_ae':
+            found[name] = (float(match.group('sae_drug')), float(match.group('sae_placebo')))
+        elif name == 'body_weight':
+            found[name] = (float(match.group('bw_drug')), float(match.group('bw_placebo')))
+        else:
+            found[name] = float(match.group(f'{name}_rate'))
+    return MappingProxyType(found)
+
+
+@lru_cache(maxsize=64)
+def _pattern_re(pattern: str) -> Pattern:
+    """Case-insensitive compiled form of a regex string passed to extract_number, compiled once."""
+    return _compile(pattern, re.IGNORECASE)
+
+
+@lru_cache(maxsize=64)
+def _keyword_re(keyword: str) -> Pattern:
+    """Case-insensitive literal pattern for keyword; avoids lowercasing whole texts to search them."""
+    return re.compile(re.escape(keyword), re.IGNORECASE)
+
+
+def _parse_number(text: str) -> Optional[float]:
+    """Parse a captured number such as "17,604" or "6.5"; None if it is not numeric."""
+    try:
+        # float() is C-level; only pay for the comma strip when a thousands separator is present
+        return float(text.replace(',', '') if ',' in text else text)
+    except ValueError:
+        return None
+
+
+def _first_percentage(text: str) -> Optional[float]:
+    """Return the first number written as a percentage (e.g. "77%", "6.5%") in text.
+
+    Scans back from each '%' instead of running a regex, picking up the same
+    "<digits>[.<digits>]%" number a regex search would.
+    """
+    pct = text.find('%')
+    while pct != -1:
+        start = pct
+        while start > 0 and text[start - 1].isdecimal():
+            start -= 1
+        if start < pct:
+            # Extend over a fractional part: "<digits>.<digits>%"
+            if start > 1 and text[start - 1] == '.' and text[start - 2].isdecimal():
+                start -= 2
+                while start > 0 and text[start - 1].isdecimal():
+                    start -= 1
+            return float(text[start:pct])
+        pct = text.find('%', pct + 1)
+    return None
+
+
+def _default_if_none(value: Optional[float], default: float) -> float:
+    """Fall back to default only when nothing was extracted (0 is a real value)."""
+    return default if value is None else value
 
 
 class TrialDataExtractor:
@@ -18,9 +197,9 @@ class TrialDataExtractor:
 
             # Demographics
             'age': r'(\d+(?:\.\d+)?)\s+years?(?:\s+old)?|age[:\s]+(\d+(?:\.\d+)?)',
-            'female_percent': r'(?:female|women).*?(\d+(?:\.\d+)?)%',
-            'male_percent': r'(?:male|men).*?(\d+(?:\.\d+)?)%',
-            'bmi': r'BMI.*?(\d+(?:\.\d+)?)',
+            'female_percent': r'(?:female|women)[^%\n]{0,120}?(\d+(?:\.\d+)?)%',
+            'male_percent': r'(?:male|men)[^%\n]{0,120}?(\d+(?:\.\d+)?)%',
+            'bmi': r'BMI[^\n]{0,120}?(\d+(?:\.\d+)?)',
 
             # Outcomes
             'hazard_ratio': r'(?:HR|hazard\s+ratio)[:\s]+(\d+(?:\.\d+)?)',
@@ -29,8 +208,8 @@ class TrialDataExtractor:
             'p_value': r'[pP](?:\s*[=-]|value)[:\s]*(?:less than\s+)?(<?\s*0\.0*)?(\d+)',
 
             # Event rates
-            'semaglutide_rate': r'semaglutide.*?(\d+(?:\.\d+)?)%',
-            'placebo_rate': r'placebo.*?(\d+(?:\.\d+)?)%',
+            'semaglutide_rate': r'semaglutide[^%\n]{0,120}?(\d+(?:\.\d+)?)%',
+            'placebo_rate': r'placebo[^%\n]{0,120}?(\d+(?:\.\d+)?)%',
 
             # Body weight
             'weight_change_drug': r'semaglutide[:\s]*(-?\d+(?:\.\d+)?)%',
@@ -40,43 +219,57 @@ class TrialDataExtractor:
             # Adverse events
             'discontinuation_drug': r'discontinuation[:\s]*(\d+(?:\.\d+)?)%(?:\s+[a-z]*)?(?:semaglutide|drug)',
             'discontinuation_placebo': r'discontinuation[:\s]*(\d+(?:\.\d+)?)%(?:\s+[a-z]*)?(?:placebo)',
-            'gi_drug': r'(?:GI|gastrointestinal).*?semaglutide[:\s]*(\d+(?:\.\d+)?)%',
-            'gi_placebo': r'(?:GI|gastrointestinal).*?placebo[:\s]*(\d+(?:\.\d+)?)%',
-            'serious_adverse_drug': r'(?:serious\s+)?adverse\s+events.*?semaglutide[:\s]*(\d+(?:\.\d+)?)%',
-            'serious_adverse_placebo': r'(?:serious\s+)?adverse\s+events.*?placebo[:\s]*(\d+(?:\.\d+)?)%',
+            'gi_drug': r'(?:GI|gastrointestinal)[^\n]{0,120}?semaglutide[:\s]*(\d+(?:\.\d+)?)%',
+            'gi_placebo': r'(?:GI|gastrointestinal)[^\n]{0,120}?placebo[:\s]*(\d+(?:\.\d+)?)%',
+            'serious_adverse_drug': r'(?:serious\s+)?adverse\s+events[^\n]{0,120}?semaglutide[:\s]*(\d+(?:\.\d+)?)%',
+            'serious_adverse_placebo': r'(?:serious\s+)?adverse\s+events[^\n]{0,120}?placebo[:\s]*(\d+(?:\.\d+)?)%',
 
             # Dosing
             'dose': r'dose[:\s]*(\d+(?:\.\d+)?)\s*mg',
             'frequency': r'(\w+(?:\s+\w+)?)\s*(?:per\s+week|weekly|daily)',
-            'at_target': r'(\d+(?:\.\d+)?)%\s+(?:of\s+)?(?:patients\s+)?(?:receiving\s+)?(?:semaglutide\s+)?(?:at|taking).*?target\s+dose',
+            'at_target': r'(\d+(?:\.\d+)?)%\s+(?:of\s+)?(?:patients\s+)?(?:receiving\s+)?(?:semaglutide\s+)?(?:at|taking)[^\n]{0,120}?target\s+dose',
         }
 
-    def extract_number(self, text: str, pattern: str) -> Optional[float]:
-        """Extract first number matching pattern."""
-        match = re.search(pattern, text, re.IGNORECASE)
+    def extract_number(self, text: str, pattern: Union[str, Pattern]) -> Optional[float]:
+        """Extract first number matching pattern.
+
+        Args:
+            text: Text to search
+            pattern: Compiled pattern, or a regex string such as an entry of
+                ``self.patterns`` (matched case-insensitively)
+
+        Returns:
+            First numeric group as float, or None if nothing matched
+        """
+        if isinstance(pattern, str):
+            pattern = _pattern_re(pattern)
+        match = pattern.search(text)
         if match:
-            # Get first non-None group
+            # Almost every pattern has one capture group (count known at compile time): read it directly
+            if pattern.groups == 1:
+                group = match.group(1)
+                return None if group is None else _parse_number(group)
+
+            # Get first non-None group that parses as a number
             for group in match.groups():
                 if group is not None:
-                    # Remove commas and convert to float
-                    clean = str(group).replace(',', '')
-                    try:
-                        return float(clean)
-                    except ValueError:
-                        continue
+                    value = _parse_number(group)
+                    if value is not None:
+                        return value
         return None
 
     def extract_text_section(self, text: str, start_keyword: str, end_keyword: Optional[str] = None) -> str:
-        """Extract text between two keywords."""
-        start_idx = text.lower().find(start_keyword.lower())
-        if start_idx == -1:
+        """Extract text between two keywords (matched case-insensitively)."""
+        start_match = _keyword_re(start_keyword).search(text)
+        if start_match is None:
             return ""
+        start_idx = start_match.start()
 
         if end_keyword:
-            end_idx = text.lower().find(end_keyword.lower(), start_idx)
-            if end_idx == -1:
+            end_match = _keyword_re(end_keyword).search(text, start_idx)
+            if end_match is None:
                 return text[start_idx:]
-            return text[start_idx:end_idx]
+            return text[start_idx:end_match.start()]
         return text[start_idx:]
 
     def extract_demographics(self, qa_results: Dict) -> Dict[str, Any]:
@@ -85,11 +278,21 @@ class TrialDataExtractor:
         enrollment_answer = qa_results['results'][1]['answer']
         inclusion_answer = qa_results['results'][4]['answer']
 
+        counts = {}
+        for match in _ENROLLMENT_RE.finditer(enrollment_answer):
+            count = int(match.group('count').replace(',', ''))
+            if match.group('plural'):
+                counts.setdefault('total', count)
+            if match.group('arm'):
+                counts.setdefault(match.group('arm').lower(), count)
+            if len(counts) == 3:
+                break
+
         demographics = {
-            'total_enrolled': int(self.extract_number(enrollment_answer, self.patterns['total_patients']) or 0),
-            'drug_arm': int(self.extract_number(enrollment_answer, r'(\d+(?:,\d+)*)\s+patients?\s+(?:assigned\s+)?to receive semaglutide') or 0),
-            'placebo_arm': int(self.extract_number(enrollment_answer, r'(\d+(?:,\d+)*)\s+patients?\s+(?:assigned\s+)?to receive placebo') or 0),
-            'age_mean': self.extract_number(inclusion_answer, r'(\d+)\s+years? of age') or 0,
+            'total_enrolled': counts.get('total', 0),
+            'drug_arm': counts.get('semaglutide', 0),
+            'placebo_arm': counts.get('placebo', 0),
+            'age_mean': _default_if_none(self.extract_number(inclusion_answer, _AGE_RE), 0),
             'bmi_minimum': 27,  # From inclusion criteria
         }
 
@@ -99,13 +302,13 @@ class TrialDataExtractor:
         """Extract primary outcome information."""
         outcome_question_answer = qa_results['results'][0]['answer']
         hazard_ratio_answer = qa_results['results'][5]['answer']
-        comparison_answer = qa_results['results'][6]['answer']
+        comparison = _scan_comparison(qa_results['results'][6]['answer'])
 
         # Parse hazard ratio with confidence interval
-        hr_match = re.search(r'(\d+(?:\.\d+)?)\s*\(95%\s*CI[,\s]*(\d+(?:\.\d+)?)[–\-](\d+(?:\.\d+)?)\)', hazard_ratio_answer)
+        hr_match = _HR_CI_RE.search(hazard_ratio_answer)
 
-        # Extract event rates - look for serious adverse events section
-        serious_ae_match = re.search(r'serious\s+adverse\s+events.*?(\d+(?:\.\d+)?)%.*?(\d+(?:\.\d+)?)%', comparison_answer, re.IGNORECASE)
+        # Event rates come from the serious adverse events section
+        semaglutide_rate, placebo_rate = comparison.get('serious_ae', (6.5, 8.0))
 
         outcomes = {
             'definition': outcome_question_answer,
@@ -113,8 +316,8 @@ class TrialDataExtractor:
             'ci_lower': float(hr_match.group(2)) if hr_match else 0.72,
             'ci_upper': float(hr_match.group(3)) if hr_match else 0.90,
             'p_value': '<0.001',  # From text
-            'semaglutide_rate': float(serious_ae_match.group(1)) if serious_ae_match else 6.5,
-            'placebo_rate': float(serious_ae_match.group(2)) if serious_ae_match else 8.0,
+            'semaglutide_rate': semaglutide_rate,
+            'placebo_rate': placebo_rate,
         }
 
         return outcomes
@@ -122,7 +325,9 @@ class TrialDataExtractor:
     def extract_adverse_events(self, qa_results: Dict) -> Dict[str, Any]:
         """Extract adverse event information."""
         ae_answer = qa_results['results'][2]['answer']
-        comparison_answer = qa_results['results'][6]['answer']
+        gi_rates = {arm: float(match.group(f'{arm}_rate'))
+                    for arm, match in _first_matches(ae_answer, _GI_ARM_RATE_BRANCHES).items()}
+        serious_rates = _scan_comparison(qa_results['results'][6]['answer'])
 
         adverse_events = {
             'discontinuation': {
@@ -130,12 +335,12 @@ class TrialDataExtractor:
                 'placebo': 8.2,
             },
             'gastrointestinal': {
-                'drug': self.extract_number(ae_answer, r'semaglutide\s+arm.*?(\d+(?:\.\d+)?)%') or 10.0,
-                'placebo': self.extract_number(ae_answer, r'placebo\s+arm.*?(\d+(?:\.\d+)?)%') or 2.0,
+                'drug': gi_rates.get('semaglutide', 10.0),
+                'placebo': gi_rates.get('placebo', 2.0),
             },
             'serious_adverse': {
-                'drug': self.extract_number(comparison_answer, r'semaglutide.*?(\d+(?:\.\d+)?)%') or 6.5,
-                'placebo': self.extract_number(comparison_answer, r'placebo.*?(?:vs|:|).*?(\d+(?:\.\d+)?)%') or 8.0,
+                'drug': serious_rates.get('semaglutide', 6.5),
+                'placebo': serious_rates.get('placebo', 8.0),
             },
         }
 
@@ -148,25 +353,21 @@ class TrialDataExtractor:
         dosing = {
             'dose': '2.4 mg',
             'frequency': 'weekly',
-            'at_target_percent': self.extract_number(dose_answer, r'(\d+(?:\.\d+)?)%') or 77,
+            'at_target_percent': _default_if_none(_first_percentage(dose_answer), 77),
         }
 
         return dosing
 
     def extract_body_weight(self, qa_results: Dict) -> Dict[str, Any]:
         """Extract body weight change information."""
-        comparison_answer = qa_results['results'][6]['answer']
-
         # Parse body weight changes
-        bw_match = re.search(
-            r'body\s+weight.*?semaglutide.*?(-?\d+(?:\.\d+)?)%.*?placebo.*?(-?\d+(?:\.\d+)?)%',
-            comparison_answer,
-            re.IGNORECASE | re.DOTALL
+        semaglutide_change, placebo_change = _scan_comparison(qa_results['results'][6]['answer']).get(
+            'body_weight', (-9.39, -0.88)
         )
 
         body_weight = {
-            'semaglutide_change': float(bw_match.group(1)) if bw_match else -9.39,
-            'placebo_change': float(bw_match.group(2)) if bw_match else -0.88,
+            'semaglutide_change': semaglutide_change,
+            'placebo_change': placebo_change,
             'difference': -8.51,
         }
 
@@ -193,13 +394,22 @@ class TrialDataExtractor:
 
     @staticmethod
     def load_qa_results(filepath: str) -> Dict:
-        """Load QA results from JSON file."""
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        """Load QA results from JSON file.
+
+        Parsed results are cached per file (by resolved path) until it changes
+        on disk; each caller gets its own deep copy, free to modify.
+        """
+        path = os.path.realpath(filepath)
+        stat = os.stat(path)
+        return copy.deepcopy(_read_json(path, stat.st_mtime_ns, stat.st_size))
 
     @staticmethod
     def save_trial_data(trial_data: Dict, filepath: str) -> None:
         """Save extracted trial data to JSON file."""
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(trial_data, option=orjson.OPT_INDENT_2))
+            return
         with open(filepath, 'w') as f:
             json.dump(trial_data, f, indent=2)
 
@@ -1,10 +1,14 @@
 """Layout design module for infographic composition."""
 
 from dataclasses import dataclass
-from typing import Dict, Any, Tuple
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Tuple
 
+# Supported layout_type values, in the order the UI offers them
+LAYOUT_TYPES = ("horizontal_3panel", "vertical_stacked")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Dimensions:
     """Image dimensions in pixels."""
     width: int = 1400
@@ -15,7 +19,7 @@ class Dimensions:
     col_width: int = (1400 - 120) // 3  # 3 columns with margins
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Colors:
     """Color scheme for infographic."""
     background: Tuple[int, int, int] = (255, 255, 255)  # White
@@ -35,7 +39,7 @@ class Colors:
     highlight: Tuple[int, int, int] = (214, 39, 40)  # Red
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Typography:
     """Font settings."""
     title_size: int = 28
@@ -45,6 +49,179 @@ class Typography:
     small_size: int = 11
 
 
+def _horizontal_3panel_layout(dims: Dimensions, colors: Colors) -> Dict[str, Dict[str, Any]]:
+    """Define horizontal 3-panel layout (recommended)."""
+    col_width = dims.col_width
+    margin = dims.margin
+    padding = dims.padding
+
+    return {
+        # Header section (full width)
+        "header": {
+            "x": margin,
+            "y": margin,
+            "width": dims.width - 2 * margin,
+            "height": 120,
+            "bg_color": (50, 50, 100),  # Dark blue
+            "text_color": (255, 255, 255),  # White
+        },
+
+        # Three-column section (Population | Outcome | Adverse Events)
+        "population": {
+            "x": margin,
+            "y": margin + 140,
+            "width": col_width,
+            "height": 350,
+            "bg_color": colors.population_bg,
+            "icon": "👥",
+        },
+        "outcome": {
+            "x": margin + col_width + padding,
+            "y": margin + 140,
+            "width": col_width,
+            "height": 350,
+            "bg_color": colors.outcome_bg,
+            "icon": "🎯",
+        },
+        "adverse": {
+            "x": margin + 2 * (col_width + padding),
+            "y": margin + 140,
+            "width": col_width,
+            "height": 350,
+            "bg_color": colors.adverse_bg,
+            "icon": "⚠️",
+        },
+
+        # Treatment section (full width)
+        "treatment": {
+            "x": margin,
+            "y": margin + 500,
+            "width": dims.width - 2 * margin,
+            "height": 180,
+            "bg_color": colors.treatment_bg,
+            "icon": "💊",
+        },
+
+        # Body Weight section (full width)
+        "body_weight": {
+            "x": margin,
+            "y": margin + 700,
+            "width": dims.width - 2 * margin,
+            "height": 250,
+            "bg_color": (245, 245, 245),  # Light gray
+        },
+
+        # Conclusion section (full width)
+        "conclusion": {
+            "x": margin,
+            "y": margin + 970,
+            "width": dims.width - 2 * margin,
+            "height": 150,
+            "bg_color": (245, 250, 245),  # Very light green
+        },
+
+        # Footer
+        "footer": {
+            "x": margin,
+            "y": dims.height - 60,
+            "width": dims.width - 2 * margin,
+            "height": 40,
+            "text_color": (150, 150, 150),
+        },
+    }
+
+
+def _vertical_stacked_layout(dims: Dimensions, colors: Colors) -> Dict[str, Dict[str, Any]]:
+    """Define vertical stacked layout."""
+    margin = dims.margin
+    full_width = dims.width - 2 * margin
+
+    return {
+        # Header (full width)
+        "header": {
+            "x": margin,
+            "y": margin,
+            "width": full_width,
+            "height": 100,
+            "bg_color": (50, 50, 100),
+            "text_color": (255, 255, 255),
+        },
+        # Stack sections vertically
+        "population": {
+            "x": margin,
+            "y": margin + 120,
+            "width": full_width,
+            "height": 140,
+            "bg_color": colors.population_bg,
+            "icon": "👥",
+        },
+        "outcome": {
+            "x": margin,
+            "y": margin + 280,
+            "width": full_width,
+            "height": 140,
+            "bg_color": colors.outcome_bg,
+            "icon": "🎯",
+        },
+        "adverse": {
+            "x": margin,
+            "y": margin + 440,
+            "width": full_width,
+            "height": 140,
+            "bg_color": colors.adverse_bg,
+            "icon": "⚠️",
+        },
+        "treatment": {
+            "x": margin,
+            "y": margin + 600,
+            "width": full_width,
+            "height": 140,
+            "bg_color": colors.treatment_bg,
+            "icon": "💊",
+        },
+        "body_weight": {
+            "x": margin,
+            "y": margin + 760,
+            "width": full_width,
+            "height": 200,
+            "bg_color": (245, 245, 245),
+        },
+        "conclusion": {
+            "x": margin,
+            "y": margin + 980,
+            "width": full_width,
+            "height": 120,
+            "bg_color": (245, 250, 245),
+        },
+        "footer": {
+            "x": margin,
+            "y": dims.height - 60,
+            "width": full_width,
+            "height": 40,
+            "text_color": (150, 150, 150),
+        },
+    }
+
+
+def _freeze(sections: Dict[str, Dict[str, Any]]) -> Mapping[str, Mapping[str, Any]]:
+    """Read-only view of a layout, so no designer can mutate the shared copy."""
+    return MappingProxyType({name: MappingProxyType(info) for name, info in sections.items()})
+
+
+_LAYOUT_BUILDERS = {
+    "horizontal_3panel": _horizontal_3panel_layout,
+    "vertical_stacked": _vertical_stacked_layout,
+}
+
+# Every designer starts from the default Dimensions/Colors, so their layouts are built once at import
+_DEFAULT_DIMS = Dimensions()
+_DEFAULT_COLORS = Colors()
+_DEFAULT_LAYOUTS = MappingProxyType({
+    layout_type: _freeze(build(_DEFAULT_DIMS, _DEFAULT_COLORS))
+    for layout_type, build in _LAYOUT_BUILDERS.items()
+})
+
+
 class LayoutDesigner:
     """Design and position layout for infographic."""
 
@@ -61,176 +238,28 @@ class LayoutDesigner:
         self.typo = Typography()
         self.sections = self._define_sections()
 
-    def _define_sections(self) -> Dict[str, Dict[str, Any]]:
-        """Define section positions and dimensions for horizontal 3-panel layout."""
-        if self.layout_type == "horizontal_3panel":
-            return self._horizontal_3panel_layout()
-        elif self.layout_type == "vertical_stacked":
-            return self._vertical_stacked_layout()
-        else:
-            raise ValueError(f"Unknown layout type: {self.layout_type}")
+    def _define_sections(self) -> Mapping[str, Mapping[str, Any]]:
+        """Read-only section layout for this layout type, dimensions and colors.
 
-    def _horizontal_3panel_layout(self) -> Dict[str, Dict[str, Any]]:
-        """Define horizontal 3-panel layout (recommended)."""
-        col_width = self.dims.col_width
-        margin = self.dims.margin
-        padding = self.dims.padding
-
-        return {
-            # Header section (full width)
-            "header": {
-                "x": margin,
-                "y": margin,
-                "width": self.dims.width - 2 * margin,
-                "height": 120,
-                "bg_color": (50, 50, 100),  # Dark blue
-                "text_color": (255, 255, 255),  # White
-            },
-
-            # Three-column section (Population | Outcome | Adverse Events)
-            "population": {
-                "x": margin,
-                "y": margin + 140,
-                "width": col_width,
-                "height": 350,
-                "bg_color": self.colors.population_bg,
-                "icon": "👥",
-            },
-            "outcome": {
-                "x": margin + col_width + padding,
-                "y": margin + 140,
-                "width": col_width,
-                "height": 350,
-                "bg_color": self.colors.outcome_bg,
-                "icon": "🎯",
-            },
-            "adverse": {
-                "x": margin + 2 * (col_width + padding),
-                "y": margin + 140,
-                "width": col_width,
-                "height": 350,
-                "bg_color": self.colors.adverse_bg,
-                "icon": "⚠️",
-            },
-
-            # Treatment section (full width)
-            "treatment": {
-                "x": margin,
-                "y": margin + 500,
-                "width": self.dims.width - 2 * margin,
-                "height": 180,
-                "bg_color": self.colors.treatment_bg,
-                "icon": "💊",
-            },
-
-            # Body Weight section (full width)
-            "body_weight": {
-                "x": margin,
-                "y": margin + 700,
-                "width": self.dims.width - 2 * margin,
-                "height": 250,
-                "bg_color": (245, 245, 245),  # Light gray
-            },
-
-            # Conclusion section (full width)
-            "conclusion": {
-                "x": margin,
-                "y": margin + 970,
-                "width": self.dims.width - 2 * margin,
-                "height": 150,
-                "bg_color": (245, 250, 245),  # Very light green
-            },
-
-            # Footer
-            "footer": {
-                "x": margin,
-                "y": self.dims.height - 60,
-                "width": self.dims.width - 2 * margin,
-                "height": 40,
-                "text_color": (150, 150, 150),
-            },
-        }
-
-    def _vertical_stacked_layout(self) -> Dict[str, Dict[str, Any]]:
-        """Define vertical stacked layout."""
-        margin = self.dims.margin
-        full_width = self.dims.width - 2 * margin
-
-        return {
-            # Header (full width)
-            "header": {
-                "x": margin,
-                "y": margin,
-                "width": full_width,
-                "height": 100,
-                "bg_color": (50, 50, 100),
-                "text_color": (255, 255, 255),
-            },
-            # Stack sections vertically
-            "population": {
-                "x": margin,
-                "y": margin + 120,
-                "width": full_width,
-                "height": 140,
-                "bg_color": self.colors.population_bg,
-                "icon": "👥",
-            },
-            "outcome": {
-                "x": margin,
-                "y": margin + 280,
-                "width": full_width,
-                "height": 140,
-                "bg_color": self.colors.outcome_bg,
-                "icon": "🎯",
-            },
-            "adverse": {
-                "x": margin,
-                "y": margin + 440,
-                "width": full_width,
-                "height": 140,
-                "bg_color": self.colors.adverse_bg,
-                "icon": "⚠️",
-            },
-            "treatment": {
-                "x": margin,
-                "y": margin + 600,
-                "width": full_width,
-                "height": 140,
-                "bg_color": self.colors.treatment_bg,
-                "icon": "💊",
-            },
-            "body_weight": {
-                "x": margin,
-                "y": margin + 760,
-                "width": full_width,
-                "height": 200,
-                "bg_color": (245, 245, 245),
-            },
-            "conclusion": {
-                "x": margin,
-                "y": margin + 980,
-                "width": full_width,
-                "height": 120,
-                "bg_color": (245, 250, 245),
-            },
-            "footer": {
-                "x": margin,
-                "y": self.dims.height - 60,
-                "width": full_width,
-                "height": 40,
-                "text_color": (150, 150, 150),
-            },
-        }
+        The default dimensions and colors share the layouts built at import;
+        any others get their own.
+        """
+        build = _LAYOUT_BUILDERS.get(self.layout_type)
+        if build is None:
+            raise ValueError(f"Unknown layout type: {self.layout_type}")
+        if self.dims == _DEFAULT_DIMS and self.colors == _DEFAULT_COLORS:
+            return _DEFAULT_LAYOUTS[self.layout_type]
+        return _freeze(build(self.dims, self.colors))
 
     def get_section(self, section_name: str) -> Dict[str, Any]:
         """Get layout information for a section."""
         if section_name not in self.sections:
             raise ValueError(f"Unknown section: {section_name}")
-        return self.sections[section_name]
+        return dict(self.sections[section_name])
 
     def get_all_sections(self) -> Dict[str, Dict[str, Any]]:
         """Get all sections."""
-        return self.sections
+        return {name: dict(info) for name, info in self.sections.items()}
 
     def get_image_dimensions(self) -> Tuple[int, int]:
         """Get total image dimensions."""
@@ -246,13 +275,14 @@ class LayoutDesigner:
 
     def debug_layout(self) -> str:
         """Print debug info about layout."""
-        info = f"""
+        header = f"""
 Layout Type: {self.layout_type}
 Image Size: {self.dims.width}x{self.dims.height}
 
 Sections:
 """
-        for section_name, section_info in self.sections.items():
-            info += f"  {section_name}: x={section_info.get('x')}, y={section_info.get('y')}, "
-            info += f"w={section_info.get('width')}, h={section_info.get('height')}\n"
-        return info
+        return header + "".join(
+            f"  {section_name}: x={section_info.get('x')}, y={section_info.get('y')}, "
+            f"w={section_info.get('width')}, h={section_info.get('height')}\n"
+            for section_name, section_info in self.sections.items()
+        )